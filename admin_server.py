@@ -14,7 +14,8 @@ import socketserver
 import json
 import os
 import sys
-from urllib.parse import urlparse, parse_qs
+from collections import namedtuple
+from urllib.parse import parse_qs
 import socket as sock
 import struct
 import msgpack
@@ -42,6 +43,21 @@ SESSIONS = {}
 SESSION_TIMEOUT = 24 * 60 * 60  # 24 hours
 
 
+# Request target split into path and query string
+RequestPath = namedtuple('RequestPath', ['path', 'query'])
+
+
+def split_request_path(target):
+    """
+    Split an origin-form request target ('/path?query') into RequestPath.
+
+    All the handlers need from urlparse() is .path and .query; two
+    partitions get both without building a full ParseResult.
+    """
+    path, _, query = target.partition('#')[0].partition('?')
+    return RequestPath(path, query)
+
+
 def pack_message(msg_type, data):
     """Pack message for binary protocol."""
     payload = msgpack.packb(data, use_bin_type=True)
@@ -134,7 +150,7 @@ class AdminRequestHandler(http.server.SimpleHTTPRequestHandler):
 
     def do_GET(self):
         """Handle GET requests."""
-        parsed_path = urlparse(self.path)
+        parsed_path = split_request_path(self.path)
 
         # Serve admin panel - redirect root to login or dashboard
         if parsed_path.path == '/':
@@ -283,7 +299,7 @@ class AdminRequestHandler(http.server.SimpleHTTPRequestHandler):
 
     def do_POST(self):
         """Handle POST requests."""
-        parsed_path = urlparse(self.path)
+        parsed_path = split_request_path(self.path)
 
         # Login endpoint
         if parsed_path.path == '/api/auth/login':
@@ -336,7 +352,7 @@ class AdminRequestHandler(http.server.SimpleHTTPRequestHandler):
 
     def do_DELETE(self):
         """Handle DELETE requests."""
-        parsed_path = urlparse(self.path)
+        parsed_path = split_request_path(self.path)
 
         # Delete document - /api/databases/{db}/collections/{collection}/documents/{id}
         if parsed_path.path.startswith('/api/databases/') and '/documents/' in parsed_path.path:
@@ -378,7 +394,7 @@ class AdminRequestHandler(http.server.SimpleHTTPRequestHandler):
 
     def do_PUT(self):
         """Handle PUT requests."""
-        parsed_path = urlparse(self.path)
+        parsed_path = split_request_path(self.path)
 
         # Update document
         if parsed_path.path.startswith('/api/databases/') and '/documents/' in parsed_path.path:
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+NexaDB Async Server - asyncio front end for the REST API
+=========================================================
+
+Serves the same endpoints as nexadb_server.py, but accepts connections and
+reads requests on an asyncio event loop instead of one blocked thread per
+connection. Idle keep-alive connections cost no thread, and accept/recv for
+thousands of sockets is multiplexed by a single loop (uvloop if installed).
+
+Routing, authentication and responses are shared with NexaDBHandler: each
+parsed request is dispatched through the same route tables on a worker pool,
+since NexaClient calls are blocking.
+
+Request heads are read with a single readuntil() and parsed by httptools
+(the llhttp C parser) when it is installed, or by splitting the block.
+
+Usage:
+    python nexadb_async.py --port 6969 --data-dir ./nexadb_data [--workers N] [--max-workers N]
+"""
+
+import asyncio
+import io
+import os
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from nexadb_server import DEFAULT_MAX_WORKERS, LISTEN_BACKLOG, NexaDBHandler, NexaDBServer
+
+try:
+    import uvloop  # libuv-based event loop (optional)
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+try:
+    import httptools  # C HTTP parser (optional)
+    HAS_HTTPTOOLS = True
+except ImportError:
+    HAS_HTTPTOOLS = False
+
+MAX_REQUEST_HEAD = 65536  # request line + headers
+MAX_HEADERS = 100
+RCVBUF_SIZE = 1 << 20  # Larger receive buffer -> fewer reads for big bodies
+
+
+class RequestHeaders(dict):
+    """Request headers with case-insensitive lookup (names stored lower-cased)"""
+
+    def get(self, name, default=None):
+        return dict.get(self, name.lower(), default)
+
+    def __getitem__(self, name):
+        return dict.__getitem__(self, name.lower())
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name.lower())
+
+
+class _HeadCollector:
+    """httptools callbacks: collect the request target and headers"""
+
+    __slots__ = ('url', 'headers')
+
+    def __init__(self):
+        self.url = b''
+        self.headers = RequestHeaders()
+
+    def on_url(self, url: bytes):
+        self.url += url
+
+    def on_header(self, name: bytes, value: bytes):
+        if len(self.headers) >= MAX_HEADERS:
+            raise ValueError('Too many headers')
+        # Like HTTPMessage.get(), the first of repeated headers wins
+        self.headers.setdefault(name.decode('iso-8859-1').lower(), value.decode('iso-8859-1'))
+
+
+def parse_request_head(head: bytes) -> Tuple[str, str, str, RequestHeaders]:
+    """
+    Parse a request line + headers block (ending in a blank line).
+
+    Returns (method, path, version, headers); raises ValueError if malformed.
+    """
+    if HAS_HTTPTOOLS:
+        collector = _HeadCollector()
+        parser = httptools.HttpRequestParser(collector)
+        try:
+            parser.feed_data(head)
+        except httptools.HttpParserError as e:
+            raise ValueError(f'Bad request: {e}') from e
+        return (parser.get_method().decode(), collector.url.decode('iso-8859-1'),
+                'HTTP/' + parser.get_http_version(), collector.headers)
+
+    lines = head.decode('iso-8859-1').split('\r\n')
+    words = lines[0].split()
+    if len(words) != 3:
+        raise ValueError(f'Bad request line: {lines[0]!r}')
+    method, path, version = words
+
+    headers = RequestHeaders()
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, sep, value = line.partition(':')
+        if not sep:
+            raise ValueError(f'Bad header line: {line!r}')
+        headers.setdefault(name.strip().lower(), value.strip())
+    if len(headers) > MAX_HEADERS:
+        raise ValueError('Too many headers')
+    return method, path, version, headers
+
+
+class BufferedNexaDBHandler(NexaDBHandler):
+    """
+    NexaDBHandler that runs against an in-memory request/response.
+
+    Skips BaseHTTPRequestHandler's socket handling: the request has already
+    been read by the event loop, and the response (status line and headers
+    included) is collected in memory so the loop can write it back.
+    """
+
+    _scatter_writes = False  # no socket here - responses go to self.wfile
+
+    def __init__(self, method: str, path: str, request_version: str,
+                 headers: RequestHeaders, body: bytes, client_address: tuple):
+        self.command = method
+        self.path = path
+        self.request_version = request_version
+        self.requestline = f'{method} {path} {request_version}'
+        self.headers = headers
+        self.client_address = client_address
+        self.rfile = io.BytesIO(body)
+        self.wfile = io.BytesIO()
+        self.close_connection = False
+
+    def run(self) -> Tuple[bytes, bool]:
+        """Dispatch the request; returns (raw response, close_connection)"""
+        handler = getattr(self, 'do_' + self.command, None)
+        if handler is None:
+            self._send_error(f'Unsupported method ({self.command})', 501)
+        else:
+            handler()
+        return self.wfile.getvalue(), self.close_connection
+
+
+class AsyncNexaDBServer(NexaDBServer):
+    """
+    NexaDB REST server on an asyncio event loop
+
+    Features:
+    - Event-loop accept/recv (uvloop when available)
+    - HTTP/1.1 keep-alive without a thread per idle connection
+    - Same endpoints and auth as NexaDBServer
+    """
+
+    def __init__(self, host: str = '0.0.0.0', port: int = 6969, data_dir: str = './nexadb_data',
+                 max_workers: int = DEFAULT_MAX_WORKERS, workers: int = 1):
+        super().__init__(host=host, port=port, data_dir=data_dir, workers=workers,
+                         max_workers=max_workers)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='nexadb-async')
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create_socket(self) -> socket.socket:
+        """Listening socket; accepted connections inherit its buffer size"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, 'SO_REUSEPORT'):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RCVBUF_SIZE)
+        sock.bind((self.host, self.port))
+        return sock
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Read one request; returns (method, path, version, headers, body) or None on EOF"""
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None  # client closed between requests
+            raise
+        except asyncio.LimitOverrunError:
+            raise ValueError('Request head too large')
+
+        method, path, version, headers = parse_request_head(head)
+
+        content_length = int(headers.get('Content-Length', 0))
+        body = await reader.readexactly(content_length) if content_length else b''
+        return method, path, version, headers, body
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until it closes"""
+        client_address = writer.get_extra_info('peername')
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), NexaDBHandler.timeout)
+                except (ValueError, asyncio.IncompleteReadError):
+                    writer.write(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                    break
+                if request is None:
+                    break
+
+                method, path, version, headers, body = request
+                handler = BufferedNexaDBHandler(method, path, version, headers, body, client_address)
+                response, close = await self.loop.run_in_executor(self.executor, handler.run)
+                writer.write(response)
+                await writer.drain()
+
+                connection = headers.get('Connection', '').lower()
+                if close or connection == 'close' or (version == 'HTTP/1.0' and connection != 'keep-alive'):
+                    break
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        except Exception as e:
+            print(f"[ERROR] Request from {client_address} failed: {e}")
+        finally:
+            writer.close()
+
+    async def _serve(self, parent_pid: Optional[int] = None):
+        server = await asyncio.start_server(self._handle_connection, sock=self._create_socket(),
+                                            limit=MAX_REQUEST_HEAD, backlog=LISTEN_BACKLOG)
+        async with server:
+            if parent_pid is None:
+                await server.serve_forever()
+                return
+            # Worker process: serve until the parent goes away
+            while os.getppid() == parent_pid:
+                await asyncio.sleep(0.5)
+
+    def start(self):
+        """Start asyncio HTTP server"""
+        parent_pid = self._fork_workers()
+        if HAS_UVLOOP:
+            uvloop.install()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        if parent_pid is not None:
+            self.loop.run_until_complete(self._serve(parent_pid))
+            return
+
+        print(f"[ASYNC] NexaDB REST API listening on {self.host}:{self.port} "
+              f"({'uvloop' if HAS_UVLOOP else 'asyncio'} event loop)")
+        try:
+            self.loop.run_until_complete(self._serve())
+        except KeyboardInterrupt:
+            print("\n[SHUTDOWN] Shutting down server...")
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Stop server"""
+        self._stop_workers()
+        self.executor.shutdown(wait=False)
+        if NexaDBHandler.client:
+            NexaDBHandler.client.disconnect()
+        print("[SHUTDOWN] Server stopped")
+
+
+def main():
+    """Run the async REST API server (binary server must already be running)"""
+    host = os.getenv('NEXADB_HOST', '0.0.0.0')
+    port = int(os.getenv('NEXADB_PORT', 6969))
+    data_dir = os.getenv('NEXADB_DATA_DIR', './nexadb_data')
+    workers = int(os.getenv('NEXADB_WORKERS', 1))
+    max_workers = int(os.getenv('NEXADB_MAX_WORKERS', DEFAULT_MAX_WORKERS))
+
+    for i, arg in enumerate(sys.argv):
+        if arg == '--host' and i + 1 < len(sys.argv):
+            host = sys.argv[i + 1]
+        elif arg == '--port' and i + 1 < len(sys.argv):
+            port = int(sys.argv[i + 1])
+        elif arg == '--data-dir' and i + 1 < len(sys.argv):
+            data_dir = sys.argv[i + 1]
+        elif arg == '--workers' and i + 1 < len(sys.argv):
+            workers = int(sys.argv[i + 1])
+        elif arg == '--max-workers' and i + 1 < len(sys.argv):
+            max_workers = int(sys.argv[i + 1])
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    server = AsyncNexaDBServer(host=host, port=port, data_dir=data_dir, workers=workers,
+                               max_workers=max_workers)
+    server.start()
+
+
+if __name__ == '__main__':
+    main()
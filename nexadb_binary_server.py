@@ -17,7 +17,7 @@ Message Format:
     - Magic (4 bytes): 0x4E455841 ("NEXA")
     - Version (1 byte): 0x01
     - Message Type (1 byte): 0x01-0xFF
-    - Flags (2 bytes): Reserved for future use
+    - Flags (2 bytes): Bit 0 = payload is zlib-compressed
     - Payload Length (4 bytes): uint32
 
   Payload (variable):
@@ -68,8 +68,11 @@ except ImportError:
     import msgpack
 
 import hashlib
+import itertools
 import json
+import operator
 import os
+import zlib
 
 # Import NexaDB core
 sys.path.append('.')
@@ -77,6 +80,9 @@ from veloxdb_core import VeloxDB
 from toon_format import json_to_toon, toon_to_json
 from unified_auth import UnifiedAuthManager
 
+# Range operators supported by vector-search metadata filters
+VECTOR_FILTER_OPERATORS = {'$gte': operator.ge, '$lte': operator.le, '$gt': operator.gt, '$lt': operator.lt}
+
 
 class NexaDBBinaryProtocol:
     """Binary protocol constants and utilities"""
@@ -129,14 +135,34 @@ class NexaDBBinaryProtocol:
     MSG_PONG = 0x88
     MSG_CHANGE_EVENT = 0x90  # Server pushes change events
 
+    # Header flags
+    FLAG_COMPRESSED = 0x0001  # Payload is zlib-compressed
+
+    # Payloads smaller than this are not worth compressing
+    COMPRESSION_THRESHOLD = 4096
+
+    # Largest payload a compressed frame may expand to (zip-bomb guard)
+    MAX_DECOMPRESSED_SIZE = 256 * 1024 * 1024
+
     @staticmethod
-    def pack_message(msg_type: int, data: Any) -> bytes:
+    def decompress_payload(payload: bytes) -> bytes:
+        """Inflate a compressed payload, refusing output beyond MAX_DECOMPRESSED_SIZE"""
+        limit = NexaDBBinaryProtocol.MAX_DECOMPRESSED_SIZE
+        decompressor = zlib.decompressobj()
+        data = decompressor.decompress(payload, limit)
+        if decompressor.unconsumed_tail:
+            raise ValueError(f"Decompressed payload exceeds {limit} bytes")
+        return data
+
+    @staticmethod
+    def pack_message(msg_type: int, data: Any, compress: bool = False) -> bytes:
         """
         Pack message into binary protocol format.
 
         Args:
             msg_type: Message type code
             data: Data to encode (will be MessagePack encoded)
+            compress: Compress large payloads (peer must have negotiated it)
 
         Returns:
             Binary message (header + payload)
@@ -144,13 +170,19 @@ class NexaDBBinaryProtocol:
         # Encode payload with MessagePack
         payload = msgpack.packb(data, use_bin_type=True)
 
+        flags = 0
+        if compress and len(payload) > NexaDBBinaryProtocol.COMPRESSION_THRESHOLD:
+            # Level 1 keeps CPU cost low while still shrinking JSON-like data 4-6x
+            payload = zlib.compress(payload, 1)
+            flags |= NexaDBBinaryProtocol.FLAG_COMPRESSED
+
         # Build header (12 bytes)
         header = struct.pack(
             '>IBBHI',
             NexaDBBinaryProtocol.MAGIC,    # Magic (4 bytes)
             NexaDBBinaryProtocol.VERSION,  # Version (1 byte)
             msg_type,                       # Message type (1 byte)
-            0,                              # Flags (2 bytes)
+            flags,                          # Flags (2 bytes)
             len(payload)                    # Payload length (4 bytes)
         )
 
@@ -170,6 +202,32 @@ class NexaDBBinaryProtocol:
         return struct.unpack('>IBBHI', header_bytes)
 
 
+class AtomicCounter:
+    """
+    Monotonic counter that is safe to bump from many threads without a lock.
+
+    next() on an itertools.count is a single C call, so it can't interleave
+    with another thread's. value() advances both counts once; their
+    difference is the number of increment() calls. Reads hold a lock so two
+    readers can't interleave their pair of next() calls (reads are rare -
+    only get_stats() - so increments stay lock-free).
+    """
+
+    __slots__ = ('_increments', '_reads', '_read_lock')
+
+    def __init__(self):
+        self._increments = itertools.count()
+        self._reads = itertools.count()
+        self._read_lock = threading.Lock()
+
+    def increment(self):
+        next(self._increments)
+
+    def value(self) -> int:
+        with self._read_lock:
+            return next(self._increments) - next(self._reads)
+
+
 class NexaDBBinaryServer:
     """
     Binary protocol server for NexaDB.
@@ -188,7 +246,9 @@ class NexaDBBinaryServer:
         port: int = 6970,
         data_dir: str = './nexadb_data',
         max_connections: int = 1000,
-        max_workers: int = 100
+        max_workers: int = 100,
+        thread_stack_size: int = 512 * 1024,
+        prewarm_workers: bool = True
     ):
         """
         Initialize binary protocol server.
@@ -199,12 +259,17 @@ class NexaDBBinaryServer:
             data_dir: Database data directory
             max_connections: Maximum concurrent connections
             max_workers: Thread pool size
+            thread_stack_size: Stack size for pre-started worker threads in
+                bytes (0 = platform default, usually 8 MB)
+            prewarm_workers: Start every worker thread before accepting
         """
         self.host = host
         self.port = port
         self.data_dir = data_dir
         self.max_connections = max_connections
         self.max_workers = max_workers
+        self.thread_stack_size = thread_stack_size
+        self.prewarm_workers = prewarm_workers
 
         # Initialize database
         print(f"[INIT] Initializing NexaDB at {data_dir}")
@@ -233,22 +298,59 @@ class NexaDBBinaryServer:
         self.subscriptions = {}
         self.subscriptions_lock = threading.Lock()
 
+        # Client sockets that negotiated payload compression in CONNECT
+        self.compressed_sockets = set()
+
         # Statistics
+        # Lock-free counters (active connections = opened - closed)
         self.stats = {
-            'total_connections': 0,
-            'active_connections': 0,
-            'total_requests': 0,
-            'total_errors': 0,
-            'auth_failures': 0,
-            'start_time': time.time()
+            'total_connections': AtomicCounter(),
+            'closed_connections': AtomicCounter(),
+            'total_errors': AtomicCounter(),
+            'auth_failures': AtomicCounter(),
         }
-        self.stats_lock = threading.Lock()
+        self.start_time = time.time()
+
+        # Requests are counted per worker thread - each shard has one writer,
+        # so the per-message increment touches no shared state
+        self._request_shards = []  # one [count] list per worker thread
+        self._request_shards_lock = threading.Lock()
+        self._thread_local = threading.local()
 
         # Register global change stream listener
         self._setup_change_stream()
 
+    def _start_workers(self):
+        """
+        Spawn the pool threads up front, with the worker stack size.
+
+        ThreadPoolExecutor creates threads lazily on submit(), so without
+        this the first burst of connections pays for thread creation.
+        """
+        if not self.prewarm_workers:
+            return
+
+        # threading.stack_size() is process-wide, so it is only in effect
+        # while the workers start - later threads get the previous size
+        previous_stack_size = threading.stack_size(self.thread_stack_size) if self.thread_stack_size else None
+        try:
+            # Each task blocks until all have started, so no thread can be
+            # reused for the next submit() and the pool grows to max_workers
+            barrier = threading.Barrier(self.max_workers + 1)
+            for _ in range(self.max_workers):
+                self.executor.submit(barrier.wait, 10)
+            try:
+                barrier.wait(10)
+            except threading.BrokenBarrierError:
+                pass
+        finally:
+            if previous_stack_size is not None:
+                threading.stack_size(previous_stack_size)
+
     def start(self):
         """Start binary protocol server."""
+        self._start_workers()
+
         # Create socket
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -266,7 +368,8 @@ class NexaDBBinaryServer:
         print(f"Port: {self.port}")
         print(f"Data Directory: {self.data_dir}")
         print(f"Max Connections: {self.max_connections}")
-        print(f"Worker Threads: {self.max_workers}")
+        print(f"Worker Threads: {self.max_workers}"
+              f"{' (pre-started)' if self.prewarm_workers else ''}")
         print(f"\nServer listening on {self.host}:{self.port}")
         print("\nProtocol: Binary (MessagePack)")
         print("Performance: 3-10x faster than HTTP/REST")
@@ -289,9 +392,7 @@ class NexaDBBinaryServer:
                 client_socket, address = self.socket.accept()
 
                 # Update stats
-                with self.stats_lock:
-                    self.stats['total_connections'] += 1
-                    self.stats['active_connections'] += 1
+                self.stats['total_connections'].increment()
 
                 # Handle connection in thread pool
                 self.executor.submit(self.handle_connection, client_socket, address)
@@ -315,6 +416,15 @@ class NexaDBBinaryServer:
 
         print("[SHUTDOWN] Server stopped")
 
+    def _request_shard(self) -> list:
+        """This worker thread's [request count] shard (registered on first use)"""
+        shard = getattr(self._thread_local, 'request_shard', None)
+        if shard is None:
+            shard = self._thread_local.request_shard = [0]
+            with self._request_shards_lock:
+                self._request_shards.append(shard)
+        return shard
+
     def handle_connection(self, client_socket: socket.socket, address: tuple):
         """
         Handle persistent client connection.
@@ -324,8 +434,13 @@ class NexaDBBinaryServer:
             address: Client address (host, port)
         """
         print(f"[CONNECT] New connection from {address[0]}:{address[1]}")
+        request_shard = self._request_shard()
 
         try:
+            # Disable Nagle: replies are small and must not wait for the client's ACK
+            # (inside the try - a peer that already reset makes this raise)
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
             while self.running:
                 # Read message header (12 bytes)
                 header_bytes = self._recv_exact(client_socket, 12)
@@ -354,6 +469,8 @@ class NexaDBBinaryServer:
 
                 # Decode MessagePack
                 try:
+                    if flags & NexaDBBinaryProtocol.FLAG_COMPRESSED:
+                        payload_bytes = NexaDBBinaryProtocol.decompress_payload(payload_bytes)
                     data = msgpack.unpackb(payload_bytes, raw=False)
                 except Exception as e:
                     print(f"[ERROR] Failed to decode MessagePack: {e}")
@@ -361,18 +478,17 @@ class NexaDBBinaryServer:
                     continue
 
                 # Update stats
-                with self.stats_lock:
-                    self.stats['total_requests'] += 1
+                request_shard[0] += 1
 
                 # Process message
                 self._process_message(client_socket, msg_type, data, address)
 
         except Exception as e:
             print(f"[ERROR] Connection error from {address}: {e}")
-            with self.stats_lock:
-                self.stats['total_errors'] += 1
+            self.stats['total_errors'].increment()
 
         finally:
+            self.compressed_sockets.discard(client_socket)
             client_socket.close()
 
             # Remove session
@@ -385,8 +501,7 @@ class NexaDBBinaryServer:
                 if address in self.subscriptions:
                     del self.subscriptions[address]
 
-            with self.stats_lock:
-                self.stats['active_connections'] -= 1
+            self.stats['closed_connections'].increment()
 
             print(f"[DISCONNECT] Connection closed from {address[0]}:{address[1]}")
 
@@ -418,7 +533,8 @@ class NexaDBBinaryServer:
             msg_type: Message type code
             data: Data to send
         """
-        message = NexaDBBinaryProtocol.pack_message(msg_type, data)
+        compress = sock in self.compressed_sockets
+        message = NexaDBBinaryProtocol.pack_message(msg_type, data, compress)
         sock.sendall(message)
 
     def _send_success(self, sock: socket.socket, data: Any):
@@ -605,8 +721,7 @@ class NexaDBBinaryServer:
             print(f"[ERROR] Failed to process message: {e}")
             self._send_error(sock, str(e))
 
-            with self.stats_lock:
-                self.stats['total_errors'] += 1
+            self.stats['total_errors'].increment()
 
     def _handle_connect(self, sock: socket.socket, data: Dict[str, Any], address: tuple):
         """
@@ -622,8 +737,7 @@ class NexaDBBinaryServer:
 
         if not username or not password:
             self._send_error(sock, "Missing 'username' or 'password' field in CONNECT message")
-            with self.stats_lock:
-                self.stats['auth_failures'] += 1
+            self.stats['auth_failures'].increment()
             return
 
         # Authenticate user
@@ -631,8 +745,7 @@ class NexaDBBinaryServer:
 
         if not user_info:
             self._send_error(sock, "Invalid username or password")
-            with self.stats_lock:
-                self.stats['auth_failures'] += 1
+            self.stats['auth_failures'].increment()
             return
 
         # Get user's full info including database permissions (v3.0.0)
@@ -650,14 +763,23 @@ class NexaDBBinaryServer:
 
         print(f"[AUTH] User '{user_info['username']}' (role: {user_info['role']}) authenticated from {address[0]}:{address[1]}")
 
-        self._send_success(sock, {
+        response = {
             'status': 'connected',
             'server': 'NexaDB Binary Protocol',
             'version': '1.0.0',
             'authenticated': True,
             'username': user_info['username'],
             'role': user_info['role']
-        })
+        }
+
+        # Negotiate payload compression (clients that don't ask get plain payloads)
+        if data.get('compression') == 'zlib':
+            response['compression'] = 'zlib'
+            self._send_success(sock, response)
+            self.compressed_sockets.add(sock)
+            return
+
+        self._send_success(sock, response)
 
     def _handle_create(self, sock: socket.socket, data: Dict[str, Any], address: tuple = None):
         """Handle CREATE message."""
@@ -882,8 +1004,50 @@ class NexaDBBinaryServer:
         # Get database and collection
         db = self.db.database(database_name)
         collection = db.collection(collection_name)
+
+        # Count-only queries skip serializing the matched documents
+        if data.get('count_only'):
+            self._send_success(sock, {
+                'database': database_name,
+                'collection': collection_name,
+                'count': collection.count(filters)
+            })
+            return
+
         documents = collection.find(filters, limit=limit)
 
+        # Columnar queries send one list per field instead of one dict per document
+        if data.get('columnar'):
+            fields = {}
+            for doc in documents:
+                for key in doc:
+                    fields[key] = None
+
+            self._send_success(sock, {
+                'database': database_name,
+                'collection': collection_name,
+                'columns': {key: [doc.get(key) for doc in documents] for key in fields},
+                'count': len(documents)
+            })
+            return
+
+        # Streamed queries go out as STREAM_START, STREAM_CHUNK..., STREAM_END
+        if data.get('stream'):
+            chunk_size = max(1, int(data.get('chunk_size', 1000)))
+            self._send_message(sock, NexaDBBinaryProtocol.MSG_STREAM_START, {
+                'database': database_name,
+                'collection': collection_name,
+                'count': len(documents)
+            })
+            for start in range(0, len(documents), chunk_size):
+                self._send_message(sock, NexaDBBinaryProtocol.MSG_STREAM_CHUNK, {
+                    'documents': documents[start:start + chunk_size]
+                })
+            self._send_message(sock, NexaDBBinaryProtocol.MSG_STREAM_END, {
+                'count': len(documents)
+            })
+            return
+
         self._send_success(sock, {
             'database': database_name,
             'collection': collection_name,
@@ -914,43 +1078,26 @@ class NexaDBBinaryServer:
         vector_collection = db.vector_collection(collection_name, dimensions)
         results = vector_collection.search(vector, limit=limit)
 
-        # Format results
-        formatted_results = []
-        for doc_id, similarity, doc in results:
-            # Apply metadata filters if provided
-            if filters:
-                # Check if document matches all filters
-                matches = True
-                for field, condition in filters.items():
-                    doc_value = doc.get(field)
-                    if isinstance(condition, dict):
-                        # Handle operators like {'$gte': 100}
-                        for operator, operand in condition.items():
-                            if operator == '$gte' and not (doc_value >= operand):
-                                matches = False
-                                break
-                            elif operator == '$lte' and not (doc_value <= operand):
-                                matches = False
-                                break
-                            elif operator == '$gt' and not (doc_value > operand):
-                                matches = False
-                                break
-                            elif operator == '$lt' and not (doc_value < operand):
-                                matches = False
-                                break
-                    else:
-                        # Simple equality check
-                        if doc_value != condition:
-                            matches = False
-                            break
-                if not matches:
-                    continue
+        # Apply metadata filters if provided: flatten them once into
+        # (field, test, operand) checks, e.g. {'price': {'$gte': 100}} or {'genre': 'scifi'}
+        if filters:
+            checks = []
+            for field, condition in filters.items():
+                if isinstance(condition, dict):
+                    # Handle operators like {'$gte': 100} (others are ignored)
+                    checks.extend((field, VECTOR_FILTER_OPERATORS[op], operand)
+                                  for op, operand in condition.items() if op in VECTOR_FILTER_OPERATORS)
+                else:
+                    # Simple equality check
+                    checks.append((field, operator.eq, condition))
+            results = [result for result in results
+                       if all(test(result[2].get(field), operand) for field, test, operand in checks)]
 
-            formatted_results.append({
-                'document_id': doc_id,
-                'similarity': float(similarity),
-                'document': doc
-            })
+        # Format results (similarities are already Python floats)
+        formatted_results = [
+            {'document_id': doc_id, 'similarity': similarity, 'document': doc}
+            for doc_id, similarity, doc in results
+        ]
 
         self._send_success(sock, {
             'database': database_name,
@@ -1435,9 +1582,11 @@ class NexaDBBinaryServer:
                     collection = parts[3]
                     doc_id = parts[4]
 
-                    # Parse vector to get dimensions
-                    vector = json.loads(vector_bytes.decode('utf-8'))
-                    dimensions = len(vector)
+                    # Vectors are stored as float32 bytes (numpy) or as JSON
+                    try:
+                        dimensions = len(json.loads(vector_bytes))
+                    except ValueError:
+                        dimensions = len(vector_bytes) // 4
 
                     vector_data[collection]['count'] += 1
                     vector_data[collection]['documents'].append({
@@ -1811,13 +1960,19 @@ class NexaDBBinaryServer:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get server statistics."""
-        with self.stats_lock:
-            uptime = time.time() - self.stats['start_time']
-            return {
-                **self.stats,
-                'uptime_seconds': uptime,
-                'requests_per_second': self.stats['total_requests'] / uptime if uptime > 0 else 0
-            }
+        counts = {name: counter.value() for name, counter in self.stats.items()}
+        counts['total_requests'] = sum(shard[0] for shard in self._request_shards)
+        uptime = time.time() - self.start_time
+        return {
+            'total_connections': counts['total_connections'],
+            'active_connections': counts['total_connections'] - counts['closed_connections'],
+            'total_requests': counts['total_requests'],
+            'total_errors': counts['total_errors'],
+            'auth_failures': counts['auth_failures'],
+            'start_time': self.start_time,
+            'uptime_seconds': uptime,
+            'requests_per_second': counts['total_requests'] / uptime if uptime > 0 else 0
+        }
 
 
 def main():
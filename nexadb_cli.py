@@ -16,6 +16,7 @@ Interactive Commands:
     VECTOR_SEARCH <vector> [limit]    - Vector similarity search
     COUNT [json]                      - Count documents
     COLLECTIONS                       - List all collections
+    STATUS                            - Server, collection and vector overview
     HELP                              - Show help
     EXIT / QUIT / \\q                  - Exit CLI
 """
@@ -28,6 +29,12 @@ import cmd
 import os
 from typing import Optional, Dict, Any, List
 
+try:
+    import orjson  # C-implemented pretty printing
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -46,7 +53,14 @@ def colored(text: str, color: str) -> str:
 
 def print_json(data: Any, indent: int = 2) -> None:
     """Pretty print JSON data with colors."""
-    json_str = json.dumps(data, indent=indent, ensure_ascii=False)
+    json_str = None
+    if HAS_ORJSON and indent == 2:
+        try:
+            json_str = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. non-string keys - fall back to stdlib json
+    if json_str is None:
+        json_str = json.dumps(data, indent=indent, ensure_ascii=False)
     print(colored(json_str, Colors.OKCYAN))
 
 def print_success(message: str) -> None:
@@ -323,13 +337,30 @@ Type 'HELP' for commands or 'EXIT' to quit.
         Usage: COLLECTIONS
         """
         try:
-            # Try to list collections (if method exists)
-            # For now, just show current collection
-            if self.current_collection:
-                print_info(f"Current collection: {self.current_collection}")
-            else:
-                print_warning("No collection selected")
-                print_info("Use 'USE <collection>' to switch to a collection")
+            collections = self.client.list_collections()
+            if not collections:
+                print_warning("No collections found")
+                return
+
+            print_success(f"{len(collections)} collection(s):")
+            for name in collections:
+                marker = '*' if name == self.current_collection else ' '
+                print(f"  {marker} {name}")
+        except Exception as e:
+            print_error(f"Error: {e}")
+
+    def do_STATUS(self, args: str):
+        """Show server status, collections and vector stats.
+
+        Usage: STATUS
+        """
+        try:
+            # Fetched in a single pipelined round trip
+            status = self.client.status()
+            print_success(f"Server: {status['server'].get('status', 'ok')}")
+            print_info(f"Collections ({len(status['collections'])}): {', '.join(status['collections'])}")
+            print_info("Vectors:")
+            print_json(status['vectors'])
         except Exception as e:
             print_error(f"Error: {e}")
 
@@ -343,6 +374,7 @@ Type 'HELP' for commands or 'EXIT' to quit.
 Collection Management:
   USE <collection>              Switch to a collection
   COLLECTIONS                   List all collections
+  STATUS                        Server, collection and vector overview
 
 Document Operations:
   CREATE <json>                 Create a document
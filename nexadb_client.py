@@ -21,7 +21,10 @@ import struct
 import threading
 import time
 import queue
-from typing import Dict, Any, List, Optional, Tuple
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from queue import Queue, Empty
 import msgpack
 
@@ -30,6 +33,9 @@ import msgpack
 MAGIC = 0x4E455841  # "NEXA"
 VERSION = 0x01
 
+# Header: magic, version, message type, flags, payload length (12 bytes)
+HEADER = struct.Struct('>IBBHI')
+
 # Client → Server message types
 MSG_CONNECT = 0x01
 MSG_CREATE = 0x02
@@ -64,9 +70,121 @@ MSG_SUCCESS = 0x81
 MSG_ERROR = 0x82
 MSG_NOT_FOUND = 0x83
 MSG_DUPLICATE = 0x84
+MSG_STREAM_START = 0x85
+MSG_STREAM_CHUNK = 0x86
+MSG_STREAM_END = 0x87
 MSG_PONG = 0x88
 MSG_CHANGE_EVENT = 0x90  # Server pushes change events
 
+# Header flags
+FLAG_COMPRESSED = 0x0001  # Payload is zlib-compressed
+
+# Payloads smaller than this are sent uncompressed
+COMPRESSION_THRESHOLD = 4096
+
+# Max number of pre-encoded query payloads kept per client
+QUERY_CACHE_SIZE = 1024
+
+# Receive buffer reused across reads; larger messages get a one-off buffer
+RECV_BUFFER_SIZE = 64 * 1024
+RECV_BUFFER_MAX = 1024 * 1024
+
+# Idle authenticated connections kept for reuse by stream_message()
+STREAM_POOL_SIZE = 4
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Build a hashable cache key for a query filter.
+
+    Scalars keep their type in the key so that True, 1 and 1.0 don't collide.
+
+    Returns:
+        Hashable key, or None if the value contains unsupported types
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return (value.__class__, value)
+    if isinstance(value, dict):
+        items = []
+        for k, v in value.items():
+            frozen = _freeze(v)
+            if frozen is None:
+                return None
+            items.append((k, frozen))
+        return (dict, tuple(items))
+    if isinstance(value, (list, tuple)):
+        items = []
+        for v in value:
+            frozen = _freeze(v)
+            if frozen is None:
+                return None
+            items.append(frozen)
+        return (list, tuple(items))
+    return None
+
+
+class _TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Used for opt-in client-side caching of idempotent reads. Values are
+    stored MessagePack-encoded, so each get() returns a fresh deep copy the
+    caller may mutate.
+
+    pop()/clear() bump a generation counter, and set() drops a value read
+    under an older generation - a read that raced a write can't put the
+    pre-write value back.
+    """
+
+    MISSING = object()
+
+    def __init__(self, ttl: float, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires_at, packed value)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def generation(self) -> int:
+        """Current generation - take it before reading the value to cache"""
+        return self._generation
+
+    def get(self, key: Any) -> Any:
+        """Return cached value, or _TTLCache.MISSING if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return self.MISSING
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return self.MISSING
+            self._entries.move_to_end(key)
+        return msgpack.unpackb(entry[1], raw=False)
+
+    def set(self, key: Any, value: Any, generation: int) -> None:
+        """Cache value unless something was invalidated since `generation`"""
+        packed = msgpack.packb(value, use_bin_type=True)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, packed)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, *keys: Any) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
 
 class NexaDBError(Exception):
     """Base exception for NexaDB errors."""
@@ -88,6 +206,11 @@ class OperationError(NexaDBError):
     pass
 
 
+class NotFoundError(OperationError):
+    """Requested document or resource does not exist."""
+    pass
+
+
 class NexaDBConnection:
     """
     Single persistent connection to NexaDB.
@@ -103,7 +226,8 @@ class NexaDBConnection:
         username: str = 'root',
         password: str = 'nexadb123',
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        compression: bool = True
     ):
         """
         Initialize connection.
@@ -115,6 +239,7 @@ class NexaDBConnection:
             password: Password for authentication
             timeout: Socket timeout in seconds
             max_retries: Max reconnection attempts
+            compression: Request zlib compression of large payloads
         """
         self.host = host
         self.port = port
@@ -122,11 +247,23 @@ class NexaDBConnection:
         self.password = password
         self.timeout = timeout
         self.max_retries = max_retries
+        self.compression = compression
+        self.compression_enabled = False  # Set once the server agrees in CONNECT
 
         self.socket: Optional[socket.socket] = None
         self.connected = False
         self.lock = threading.RLock()  # Re-entrant lock for thread safety
 
+        # Reusable receive buffer (avoids a new bytes object per recv chunk)
+        self._recv_buffer = bytearray(RECV_BUFFER_SIZE)
+
+        # Reusable MessagePack encoder (used under self.lock only)
+        self._packer = msgpack.Packer(use_bin_type=True)
+
+        # Idle connections for streamed responses (already authenticated)
+        self._stream_pool: List['NexaDBConnection'] = []
+        self._stream_pool_lock = threading.Lock()
+
         # Statistics (like MySQL SHOW STATUS)
         self.stats = {
             'connections_made': 0,
@@ -153,6 +290,8 @@ class NexaDBConnection:
                     # Create socket
                     self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                     self.socket.settimeout(self.timeout)
+                    # Request/response framing: don't let Nagle hold back small requests
+                    self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                     self.socket.connect((self.host, self.port))
 
                     # Authenticate
@@ -189,7 +328,12 @@ class NexaDBConnection:
             )
 
     def disconnect(self) -> None:
-        """Close connection gracefully."""
+        """Close connection gracefully (and any idle stream connections)."""
+        with self._stream_pool_lock:
+            pool, self._stream_pool = self._stream_pool, []
+        for conn in pool:
+            conn.disconnect()
+
         with self.lock:
             if self.socket:
                 try:
@@ -199,6 +343,7 @@ class NexaDBConnection:
                 finally:
                     self.socket = None
                     self.connected = False
+                    self.compression_enabled = False
 
     def _ensure_connected(self) -> None:
         """Ensure connection is active, reconnect if needed."""
@@ -207,21 +352,30 @@ class NexaDBConnection:
 
     def _send_connect(self) -> None:
         """Send authentication handshake."""
-        response = self._send_message_internal(MSG_CONNECT, {
+        self.compression_enabled = False
+
+        message_data = {
             'username': self.username,
             'password': self.password
-        })
+        }
+        if self.compression:
+            message_data['compression'] = 'zlib'
+
+        response = self._send_message_internal(MSG_CONNECT, message_data)
 
         if not response.get('authenticated'):
             raise AuthenticationError(f"Authentication failed for user '{self.username}'")
 
-    def _send_message_internal(self, msg_type: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        # Older servers ignore the request and keep sending plain payloads
+        self.compression_enabled = response.get('compression') == 'zlib'
+
+    def _send_message_internal(self, msg_type: int, data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         """
         Send binary message and receive response (internal, no locking).
 
         Args:
             msg_type: Message type code
-            data: Message data
+            data: Message data, or an already MessagePack-encoded payload
 
         Returns:
             Response data
@@ -230,35 +384,68 @@ class NexaDBConnection:
             ConnectionError: If not connected
             OperationError: If server returns error
         """
+        self._send_frame(msg_type, data)
+
+        # Read response
+        return self._read_response()
+
+    def _send_frame(self, msg_type: int, data: Union[Dict[str, Any], bytes]) -> None:
+        """
+        Send one binary message without waiting for the response (internal, no locking).
+
+        Args:
+            msg_type: Message type code
+            data: Message data, or an already MessagePack-encoded payload
+
+        Raises:
+            ConnectionError: If not connected
+        """
         if not self.socket:
             raise ConnectionError("Not connected")
 
+        # Send header + payload
+        self.socket.sendall(self._encode_frame(msg_type, data))
+
+    def _encode_frame(self, msg_type: int, data: Union[Dict[str, Any], bytes]) -> bytes:
+        """
+        Encode one binary message (header + payload).
+
+        Args:
+            msg_type: Message type code
+            data: Message data, or an already MessagePack-encoded payload
+
+        Returns:
+            Binary message
+        """
         # Encode payload with MessagePack
-        payload = msgpack.packb(data, use_bin_type=True)
+        if isinstance(data, bytes):
+            payload = data
+        else:
+            payload = self._packer.pack(data)
+
+        flags = 0
+        if self.compression_enabled and len(payload) > COMPRESSION_THRESHOLD:
+            payload = zlib.compress(payload, 1)
+            flags |= FLAG_COMPRESSED
 
         # Build header (12 bytes)
-        header = struct.pack(
-            '>IBBHI',
+        header = HEADER.pack(
             MAGIC,       # Magic (4 bytes)
             VERSION,     # Version (1 byte)
             msg_type,    # Message type (1 byte)
-            0,           # Flags (2 bytes)
+            flags,       # Flags (2 bytes)
             len(payload) # Payload length (4 bytes)
         )
 
-        # Send header + payload
-        self.socket.sendall(header + payload)
+        return header + payload
 
-        # Read response
-        return self._read_response()
-
-    def send_message(self, msg_type: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    def send_message(self, msg_type: int, data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         """
         Send binary message with automatic reconnection.
 
         Args:
             msg_type: Message type code
-            data: Message data
+            data: Message data, or an already MessagePack-encoded payload
 
         Returns:
             Response data
@@ -268,30 +455,98 @@ class NexaDBConnection:
             OperationError: If operation fails
         """
         with self.lock:
-            self._ensure_connected()
+            if not self.connected:
+                self.connect()
 
-            # Try sending with automatic reconnection
-            for attempt in range(self.max_retries):
-                try:
-                    result = self._send_message_internal(msg_type, data)
-                    self.stats['queries_executed'] += 1
-                    return result
+            # Fast path: no retry bookkeeping unless the send actually fails
+            try:
+                result = self._send_message_internal(msg_type, data)
+            except (BrokenPipeError, OSError, ConnectionError) as e:
+                return self._retry_message(msg_type, data, e)
 
-                except (BrokenPipeError, OSError, ConnectionError) as e:
-                    # Connection lost, try to reconnect
-                    self.connected = False
-                    if attempt < self.max_retries - 1:
-                        print(f"[RECONNECT] Connection lost, attempting reconnect ({attempt + 1}/{self.max_retries})")
-                        try:
-                            self.connect()
-                        except:
-                            pass
-                    else:
-                        self.stats['errors_encountered'] += 1
-                        raise ConnectionError(f"Operation failed after {self.max_retries} attempts: {e}")
+            self.stats['queries_executed'] += 1
+            return result
 
-            self.stats['errors_encountered'] += 1
-            raise ConnectionError("Failed to send message after all retries")
+    def _retry_message(self, msg_type: int, data: Union[Dict[str, Any], bytes], error: Exception) -> Dict[str, Any]:
+        """
+        Reconnect and resend after a failed send (caller holds self.lock).
+
+        Args:
+            msg_type: Message type code
+            data: Message data, or an already MessagePack-encoded payload
+            error: Error from the first attempt
+
+        Returns:
+            Response data
+
+        Raises:
+            ConnectionError: If all retries fail
+        """
+        for attempt in range(1, self.max_retries):
+            # Connection lost, try to reconnect
+            self.connected = False
+            print(f"[RECONNECT] Connection lost, attempting reconnect ({attempt}/{self.max_retries})")
+            try:
+                self.connect()
+            except:
+                pass
+
+            try:
+                result = self._send_message_internal(msg_type, data)
+                self.stats['queries_executed'] += 1
+                return result
+            except (BrokenPipeError, OSError, ConnectionError) as e:
+                error = e
+
+        self.connected = False
+        self.stats['errors_encountered'] += 1
+        raise ConnectionError(f"Operation failed after {self.max_retries} attempts: {error}")
+
+    def send_pipeline(self, messages: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several messages back-to-back and read all responses.
+
+        The server processes messages on a connection in order, so writing
+        them together costs one round trip instead of one per message.
+        Pipelines are not retried on connection loss, since some messages
+        may already have been applied.
+
+        Args:
+            messages: List of (msg_type, data) tuples
+
+        Returns:
+            Response data for each message, in order
+
+        Raises:
+            ConnectionError: If connection fails
+            OperationError: If any operation fails (raised after all
+                responses have been read)
+        """
+        with self.lock:
+            self._ensure_connected()
+
+            try:
+                self.socket.sendall(b''.join(
+                    self._encode_frame(msg_type, data) for msg_type, data in messages
+                ))
+
+                results = []
+                error = None
+                for _ in messages:
+                    try:
+                        results.append(self._read_response())
+                    except OperationError as e:
+                        results.append(None)
+                        error = error or e
+            except (OSError, ConnectionError) as e:
+                self.stats['errors_encountered'] += 1
+                self.disconnect()
+                raise ConnectionError(f"Pipeline failed: {e}")
+
+            self.stats['queries_executed'] += len(messages)
+            if error:
+                raise error
+            return results
 
     def _read_response(self) -> Dict[str, Any]:
         """
@@ -302,12 +557,32 @@ class NexaDBConnection:
 
         Raises:
             ConnectionError: If connection closed
+            NotFoundError: If server reports the key doesn't exist
+            OperationError: If server returns error
+        """
+        msg_type, data = self._read_message()
+
+        if msg_type == MSG_SUCCESS or msg_type == MSG_PONG or msg_type == MSG_CHANGE_EVENT:
+            return data
+        else:
+            raise ValueError(f"Unknown response type: {msg_type}")
+
+    def _read_message(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        Read one binary message from server.
+
+        Returns:
+            (msg_type, data)
+
+        Raises:
+            ConnectionError: If connection closed
+            NotFoundError: If server reports the key doesn't exist
             OperationError: If server returns error
         """
         # Read header (12 bytes)
-        header = self._recv_exact(12)
+        header = self._recv_exact(HEADER.size)
 
-        magic, version, msg_type, flags, payload_len = struct.unpack('>IBBHI', header)
+        magic, version, msg_type, flags, payload_len = HEADER.unpack(header)
 
         # Verify magic
         if magic != MAGIC:
@@ -315,40 +590,135 @@ class NexaDBConnection:
 
         # Read payload
         payload = self._recv_exact(payload_len)
+        if flags & FLAG_COMPRESSED:
+            payload = zlib.decompress(payload)
 
         # Decode MessagePack
         data = msgpack.unpackb(payload, raw=False)
 
-        # Handle response type
-        if msg_type == MSG_SUCCESS or msg_type == MSG_PONG or msg_type == MSG_CHANGE_EVENT:
-            return data
-        elif msg_type == MSG_ERROR:
+        # Handle error responses
+        if msg_type == MSG_ERROR:
             raise OperationError(data.get('error', 'Unknown error'))
         elif msg_type == MSG_NOT_FOUND:
-            raise OperationError('Not found')
-        else:
-            raise ValueError(f"Unknown response type: {msg_type}")
+            raise NotFoundError('Not found')
 
-    def _recv_exact(self, n: int) -> bytes:
+        return msg_type, data
+
+    def stream_message(self, msg_type: int, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Send binary message and yield each message of a streamed response.
+
+        The stream runs on its own connection, so this connection and its
+        lock stay free for other threads while the caller iterates - even if
+        an iterator is left half-consumed. Connections that read their stream
+        to the end go back to a small pool and are reused without logging in
+        again; stopping early just closes the stream's connection.
+
+        Args:
+            msg_type: Message type code
+            data: Message data
+
+        Yields:
+            Data of each STREAM_CHUNK message (or the single response from
+            servers that don't stream)
+
+        Raises:
+            ConnectionError: If connection fails
+            OperationError: If operation fails
+        """
+        with self._stream_pool_lock:
+            conn = self._stream_pool.pop() if self._stream_pool else None
+        reusable = False  # True once the stream has been read to the end
+
+        try:
+            try:
+                if conn is None:
+                    conn = self._open_stream_connection()
+                    msg_type, response = self._start_stream(conn, msg_type, data)
+                else:
+                    try:
+                        msg_type, response = self._start_stream(conn, msg_type, data)
+                    except (OSError, ConnectionError):
+                        # The server dropped the idle connection - use a fresh one
+                        conn.disconnect()
+                        conn = self._open_stream_connection()
+                        msg_type, response = self._start_stream(conn, msg_type, data)
+            except OperationError:
+                # Error response was read in full, the connection is still usable
+                reusable = True
+                raise
+            with self.lock:
+                self.stats['queries_executed'] += 1
+
+            if msg_type != MSG_STREAM_START:
+                # Server answered with a regular, non-streamed response
+                reusable = True
+                yield response
+                return
+
+            while True:
+                msg_type, response = conn._read_message()
+                if msg_type == MSG_STREAM_END:
+                    reusable = True
+                    return
+                yield response
+        finally:
+            if conn is not None:
+                self._release_stream_connection(conn, reusable)
+
+    def _open_stream_connection(self) -> 'NexaDBConnection':
+        """Open and authenticate a connection for stream_message()."""
+        conn = NexaDBConnection(self.host, self.port, self.username, self.password,
+                                self.timeout, self.max_retries, self.compression)
+        conn.connect()
+        return conn
+
+    @staticmethod
+    def _start_stream(conn: 'NexaDBConnection', msg_type: int, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """Send the request on conn and read the first response message."""
+        conn._send_frame(msg_type, data)
+        return conn._read_message()
+
+    def _release_stream_connection(self, conn: 'NexaDBConnection', reusable: bool) -> None:
+        """Return a stream connection to the pool, or close it."""
+        if reusable and conn.connected:
+            with self._stream_pool_lock:
+                if len(self._stream_pool) < STREAM_POOL_SIZE:
+                    self._stream_pool.append(conn)
+                    return
+        conn.disconnect()
+
+    def _recv_exact(self, n: int) -> memoryview:
         """
         Receive exactly n bytes from socket.
 
+        Reads straight into the connection's reusable buffer with recv_into,
+        so the returned view is only valid until the next read.
+
         Args:
             n: Number of bytes to read
 
         Returns:
-            Bytes read
+            Bytes read (memoryview)
 
         Raises:
             ConnectionError: If connection closed
         """
-        data = b''
-        while len(data) < n:
-            chunk = self.socket.recv(n - len(data))
-            if not chunk:
+        if n <= len(self._recv_buffer):
+            buffer = self._recv_buffer
+        elif n <= RECV_BUFFER_MAX:
+            self._recv_buffer = buffer = bytearray(n)
+        else:
+            buffer = bytearray(n)
+
+        view = memoryview(buffer)[:n]
+        received = 0
+        while received < n:
+            count = self.socket.recv_into(view[received:], n - received)
+            if not count:
                 raise ConnectionError("Connection closed by server")
-            data += chunk
-        return data
+            received += count
+        return view
 
     def __enter__(self):
         """Context manager entry."""
@@ -391,7 +761,9 @@ class NexaClient:
         username: str = 'root',
         password: str = 'nexadb123',
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        compression: bool = True,
+        cache_ttl: float = 0
     ):
         """
         Initialize NexaDB client.
@@ -403,15 +775,32 @@ class NexaClient:
             password: Password (default: 'nexadb123')
             timeout: Connection timeout (default: 30s)
             max_retries: Max reconnection attempts (default: 3)
+            compression: Negotiate zlib compression for payloads over 4KB (default: True)
+            cache_ttl: Cache get/list_collections/get_vectors results for this
+                many seconds (default: 0 = disabled). Writes made through this
+                client invalidate affected entries; writes by other clients
+                become visible once the TTL expires.
         """
-        self.conn = NexaDBConnection(host, port, username, password, timeout, max_retries)
+        self.conn = NexaDBConnection(host, port, username, password, timeout, max_retries, compression)
+
+        # Opt-in read cache for idempotent operations
+        self._cache: Optional[_TTLCache] = _TTLCache(cache_ttl) if cache_ttl > 0 else None
+
+        # Encoded MSG_QUERY payloads for repeated queries (LRU)
+        self._query_cache: OrderedDict = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+        # Background executor for *_async operations (created on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
     def connect(self) -> None:
         """Connect to server."""
         self.conn.connect()
 
     def disconnect(self) -> None:
-        """Disconnect from server."""
+        """Disconnect from server (waits for pending async operations)."""
+        self._shutdown_executor()
         self.conn.disconnect()
 
     def __enter__(self):
@@ -421,8 +810,40 @@ class NexaClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
+        self._shutdown_executor()
         self.conn.disconnect()
 
+    def _submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Run an operation on the client's background executor.
+
+        A single worker is used: all operations share one connection anyway,
+        and one worker keeps async writes in submission order.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='nexadb')
+            return self._executor.submit(fn, *args, **kwargs)
+
+    def _shutdown_executor(self) -> None:
+        """Wait for pending async operations and stop the executor."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True)
+
+    def _invalidate(self, collection: str, database: Optional[str], keys: List[Any]) -> None:
+        """
+        Drop cached reads a write to `collection` may have changed.
+
+        Called after the write, so a concurrent read can't re-cache the old
+        value: the collection list, vector stats and the written documents.
+        """
+        if self._cache:
+            database = database or 'default'
+            self._cache.pop(('collections', database), 'vectors',
+                            *[('doc', database, collection, key) for key in keys if key is not None])
+
     # ============================================================================
     # CORE CRUD OPERATIONS
     # ============================================================================
@@ -454,7 +875,23 @@ class NexaClient:
         if database:
             message_data['database'] = database
 
-        return self.conn.send_message(MSG_CREATE, message_data)
+        try:
+            return self.conn.send_message(MSG_CREATE, message_data)
+        finally:
+            self._invalidate(collection, database, [data.get('_id')])
+
+    def create_async(self, collection: str, data: Dict[str, Any], database: Optional[str] = None) -> Future:
+        """
+        Insert document in the background.
+
+        Returns:
+            Future resolving to the create() result
+
+        Example:
+            >>> futures = [db.create_async('events', e) for e in events]
+            >>> ids = [f.result()['document_id'] for f in futures]
+        """
+        return self._submit(self.create, collection, data, database=database)
 
     def get(self, collection: str, key: str) -> Optional[Dict[str, Any]]:
         """
@@ -472,18 +909,26 @@ class NexaClient:
             >>> print(user['name'])
             'Alice'
         """
+        if self._cache:
+            document = self._cache.get(('doc', 'default', collection, key))
+            if document is not _TTLCache.MISSING:
+                return document
+            generation = self._cache.generation()
+
         try:
             response = self.conn.send_message(MSG_READ, {
                 'collection': collection,
                 'key': key
             })
-            return response.get('document')
-        except OperationError as e:
-            if 'Not found' in str(e):
-                return None
-            raise
+        except NotFoundError:
+            return None
 
-    def update(self, collection: str, key: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+        document = response.get('document')
+        if self._cache and document is not None:
+            self._cache.set(('doc', 'default', collection, key), document, generation)
+        return document
+
+    def update(self, collection: str, key: str, updates: Dict[str, Any], database: Optional[str] = None) -> Dict[str, Any]:
         """
         Update document.
 
@@ -491,6 +936,7 @@ class NexaClient:
             collection: Collection name
             key: Document ID
             updates: Updates to apply
+            database: Optional database name (v3.0.0). If not specified, uses 'default'.
 
         Returns:
             Update result
@@ -499,19 +945,36 @@ class NexaClient:
             >>> db.update('users', 'abc123', {'age': 30})
             {'collection': 'users', 'document_id': 'abc123', 'message': 'Document updated'}
         """
-        return self.conn.send_message(MSG_UPDATE, {
+        message_data = {
             'collection': collection,
             'key': key,
             'updates': updates
-        })
+        }
+        if database:
+            message_data['database'] = database
+
+        try:
+            return self.conn.send_message(MSG_UPDATE, message_data)
+        finally:
+            self._invalidate(collection, database, [key])
 
-    def delete(self, collection: str, key: str) -> Dict[str, Any]:
+    def update_async(self, collection: str, key: str, updates: Dict[str, Any], database: Optional[str] = None) -> Future:
+        """
+        Update document in the background.
+
+        Returns:
+            Future resolving to the update() result
+        """
+        return self._submit(self.update, collection, key, updates, database=database)
+
+    def delete(self, collection: str, key: str, database: Optional[str] = None) -> Dict[str, Any]:
         """
         Delete document.
 
         Args:
             collection: Collection name
             key: Document ID
+            database: Optional database name (v3.0.0). If not specified, uses 'default'.
 
         Returns:
             Delete result
@@ -520,18 +983,26 @@ class NexaClient:
             >>> db.delete('users', 'abc123')
             {'collection': 'users', 'document_id': 'abc123', 'message': 'Document deleted'}
         """
-        return self.conn.send_message(MSG_DELETE, {
+        message_data = {
             'collection': collection,
             'key': key
-        })
+        }
+        if database:
+            message_data['database'] = database
+
+        try:
+            return self.conn.send_message(MSG_DELETE, message_data)
+        finally:
+            self._invalidate(collection, database, [key])
 
     def query(
         self,
         collection: str,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        database: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        database: Optional[str] = None,
+        as_arrow: bool = False
+    ) -> Union[List[Dict[str, Any]], 'pyarrow.Table']:
         """
         Query documents with filters.
 
@@ -540,9 +1011,12 @@ class NexaClient:
             filters: Query filters (default: {})
             limit: Max results (default: 100)
             database: Optional database name (v3.0.0). If not specified, uses 'default'.
+            as_arrow: Return a columnar pyarrow.Table instead of a list of dicts.
+                The server sends results column-wise, so field names travel
+                once per result instead of once per document. Requires pyarrow.
 
         Returns:
-            List of matching documents
+            List of matching documents (or pyarrow.Table if as_arrow=True)
 
         Example:
             >>> users = db.query('users', {'age': {'$gte': 25}}, 10)
@@ -553,6 +1027,60 @@ class NexaClient:
             >>> orders = db.query('orders', {}, database='production')
             >>> print(len(orders))
             42
+
+            >>> # Columnar result for analytics
+            >>> table = db.query('orders', {}, limit=100000, as_arrow=True)
+            >>> table.column('total').to_numpy().sum()
+        """
+        if as_arrow:
+            return self._query_arrow(collection, filters, limit, database)
+
+        response = self.conn.send_message(MSG_QUERY, self._query_payload(collection, filters, limit, database))
+        return response.get('documents', [])
+
+    def _query_arrow(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        database: Optional[str]
+    ) -> 'pyarrow.Table':
+        """Run a columnar query and build a pyarrow.Table from the result."""
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("pyarrow is required for as_arrow=True. Install: pip install pyarrow")
+
+        message_data = {
+            'collection': collection,
+            'filters': filters or {},
+            'limit': limit,
+            'columnar': True
+        }
+        if database:
+            message_data['database'] = database
+
+        response = self.conn.send_message(MSG_QUERY, message_data)
+
+        if 'columns' in response:
+            return pyarrow.table(response['columns'])
+
+        # Server without columnar support - convert row-wise documents
+        return pyarrow.Table.from_pylist(response.get('documents', []))
+
+    def _query_payload(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        database: Optional[str]
+    ) -> Union[Dict[str, Any], bytes]:
+        """
+        Return the MSG_QUERY payload, reusing the encoded bytes for repeated queries.
+
+        Polling loops tend to issue the same query over and over; caching the
+        MessagePack encoding skips re-serializing identical filters. Filters
+        with values that can't be frozen are returned unencoded.
         """
         message_data = {
             'collection': collection,
@@ -562,8 +1090,101 @@ class NexaClient:
         if database:
             message_data['database'] = database
 
+        frozen = _freeze(message_data['filters'])
+        if frozen is None:
+            return message_data
+
+        key = (collection, frozen, limit, database)
+        with self._query_cache_lock:
+            payload = self._query_cache.get(key)
+            if payload is not None:
+                self._query_cache.move_to_end(key)
+                return payload
+
+        payload = msgpack.packb(message_data, use_bin_type=True)
+
+        with self._query_cache_lock:
+            self._query_cache[key] = payload
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+
+        return payload
+
+    def iter_query(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        database: Optional[str] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Query documents, yielding them as they arrive.
+
+        The server streams results in chunks, so only one chunk is held in
+        client memory at a time - use this instead of query() for large limits.
+
+        Args:
+            collection: Collection name
+            filters: Query filters (default: {})
+            limit: Max results (default: 100)
+            database: Optional database name (v3.0.0). If not specified, uses 'default'.
+            chunk_size: Documents per streamed chunk (default: 1000)
+
+        Yields:
+            Matching documents
+
+        Example:
+            >>> for doc in db.iter_query('events', {}, limit=1000000):
+            ...     process(doc)
+        """
+        message_data = {
+            'collection': collection,
+            'filters': filters or {},
+            'limit': limit,
+            'stream': True,
+            'chunk_size': chunk_size
+        }
+        if database:
+            message_data['database'] = database
+
+        for chunk in self.conn.stream_message(MSG_QUERY, message_data):
+            yield from chunk.get('documents', [])
+
+    def count(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
+    ) -> int:
+        """
+        Count documents matching filters (like MySQL's SELECT COUNT(*)).
+
+        Only the count travels over the wire - matching documents are never
+        serialized by the server.
+
+        Args:
+            collection: Collection name
+            filters: Query filters (default: {})
+            database: Optional database name (v3.0.0). If not specified, uses 'default'.
+
+        Returns:
+            Number of matching documents
+
+        Example:
+            >>> db.count('users', {'age': {'$gte': 25}})
+            5
+        """
+        message_data = {
+            'collection': collection,
+            'filters': filters or {},
+            'count_only': True
+        }
+        if database:
+            message_data['database'] = database
+
         response = self.conn.send_message(MSG_QUERY, message_data)
-        return response.get('documents', [])
+        return response.get('count', 0)
 
     def batch_write(self, collection: str, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -581,10 +1202,13 @@ class NexaClient:
             >>> result = db.batch_write('users', docs)
             >>> print(f"Inserted {result['count']} documents")
         """
-        return self.conn.send_message(MSG_BATCH_WRITE, {
-            'collection': collection,
-            'documents': documents
-        })
+        try:
+            return self.conn.send_message(MSG_BATCH_WRITE, {
+                'collection': collection,
+                'documents': documents
+            })
+        finally:
+            self._invalidate(collection, None, [document.get('_id') for document in documents])
 
     # ============================================================================
     # VECTOR OPERATIONS (AI/ML)
@@ -632,6 +1256,69 @@ class NexaClient:
         response = self.conn.send_message(MSG_VECTOR_SEARCH, message_data)
         return response.get('results', [])
 
+    def create_with_vector(
+        self,
+        collection: str,
+        data: Dict[str, Any],
+        vector: List[float],
+        database: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Insert document together with its embedding in a single round trip.
+
+        The server indexes the 'vector' field on insert, so there is no need
+        to create the document first and attach the vector with an update.
+
+        Args:
+            collection: Collection name
+            data: Document data
+            vector: Embedding vector
+            database: Optional database name (v3.0.0). If not specified, uses 'default'.
+
+        Returns:
+            {'collection': str, 'document_id': str, 'message': str}
+
+        Example:
+            >>> db.create_with_vector('movies', {'title': 'Inception'}, [0.1, 0.2, 0.3, 0.4])
+            {'collection': 'movies', 'document_id': 'abc123', 'message': 'Document inserted'}
+        """
+        document = dict(data)
+        document['vector'] = vector if isinstance(vector, list) else list(vector)
+        return self.create(collection, document, database=database)
+
+    def batch_write_vectors(
+        self,
+        collection: str,
+        documents: List[Dict[str, Any]],
+        vectors: List[List[float]]
+    ) -> Dict[str, Any]:
+        """
+        Bulk insert documents with their embeddings in one request.
+
+        Args:
+            collection: Collection name
+            documents: List of documents
+            vectors: List of embedding vectors (same order as documents)
+
+        Returns:
+            Insert result with document IDs
+
+        Example:
+            >>> docs = [{'title': 'Inception'}, {'title': 'Interstellar'}]
+            >>> vecs = [[0.1, 0.2, 0.3, 0.4], [0.2, 0.1, 0.4, 0.3]]
+            >>> result = db.batch_write_vectors('movies', docs, vecs)
+        """
+        if len(documents) != len(vectors):
+            raise ValueError("documents and vectors must have the same length")
+
+        merged = []
+        for data, vector in zip(documents, vectors):
+            document = dict(data)
+            document['vector'] = vector if isinstance(vector, list) else list(vector)
+            merged.append(document)
+
+        return self.batch_write(collection, merged)
+
     # ============================================================================
     # COLLECTION MANAGEMENT (like MySQL's SHOW TABLES, DROP TABLE)
     # ============================================================================
@@ -656,12 +1343,22 @@ class NexaClient:
             >>> print(collections)
             ['orders', 'customers']
         """
+        if self._cache:
+            collections = self._cache.get(('collections', database or 'default'))
+            if collections is not _TTLCache.MISSING:
+                return collections
+            generation = self._cache.generation()
+
         message_data = {}
         if database:
             message_data['database'] = database
 
         response = self.conn.send_message(MSG_LIST_COLLECTIONS, message_data)
-        return response.get('collections', [])
+        collections = response.get('collections', [])
+
+        if self._cache:
+            self._cache.set(('collections', database or 'default'), collections, generation)
+        return collections
 
     def drop_collection(self, name: str, database: Optional[str] = None) -> bool:
         """
@@ -693,6 +1390,9 @@ class NexaClient:
             return response.get('message') == 'Collection dropped'
         except OperationError:
             return False
+        finally:
+            if self._cache:
+                self._cache.clear()
 
     def get_vectors(self) -> Dict[str, Any]:
         """
@@ -705,7 +1405,17 @@ class NexaClient:
             >>> vectors = db.get_vectors()
             >>> print(f"Total vectors: {vectors['total_vectors']}")
         """
-        return self.conn.send_message(MSG_GET_VECTORS, {})
+        if self._cache:
+            vectors = self._cache.get('vectors')
+            if vectors is not _TTLCache.MISSING:
+                return vectors
+            generation = self._cache.generation()
+
+        vectors = self.conn.send_message(MSG_GET_VECTORS, {})
+
+        if self._cache:
+            self._cache.set('vectors', vectors, generation)
+        return vectors
 
     # ============================================================================
     # DATABASE MANAGEMENT (v3.0.0 - Multi-Database Support)
@@ -767,6 +1477,9 @@ class NexaClient:
             return response.get('success', False)
         except OperationError:
             return False
+        finally:
+            if self._cache:
+                self._cache.clear()
 
     def get_database_stats(self, name: str) -> Dict[str, Any]:
         """
@@ -918,6 +1631,34 @@ class NexaClient:
         """
         return self.conn.send_message(MSG_PING, {})
 
+    def status(self, database: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get server status, collections and vector stats in one round trip.
+
+        Args:
+            database: Optional database name (v3.0.0). If not specified, uses 'default'.
+
+        Returns:
+            {'server': dict, 'collections': list, 'vectors': dict}
+
+        Example:
+            >>> status = db.status()
+            >>> print(status['collections'])
+            ['users', 'products']
+        """
+        list_data = {'database': database} if database else {}
+        pong, collections, vectors = self.conn.send_pipeline([
+            (MSG_PING, {}),
+            (MSG_LIST_COLLECTIONS, list_data),
+            (MSG_GET_VECTORS, {})
+        ])
+
+        return {
+            'server': pong,
+            'collections': collections.get('collections', []),
+            'vectors': vectors
+        }
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get client statistics (like MySQL's SHOW STATUS).
@@ -971,10 +1712,10 @@ class NexaClient:
         # Background thread to receive change events
         def receive_events():
             try:
+                self.conn.socket.settimeout(1.0)  # 1 second timeout
                 while not stop_watching.is_set():
                     # Read change event from server
                     try:
-                        self.conn.socket.settimeout(1.0)  # 1 second timeout
                         event_data = self.conn._read_response()
                         event_queue.put(event_data)
                     except socket.timeout:
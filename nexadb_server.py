@@ -12,12 +12,21 @@ HTTP/REST API for NexaDB with:
 - WebSocket support (real-time queries)
 """
 
+import gzip
 import json
+import signal
+import socket
 import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from urllib.parse import unquote_plus
+from typing import Dict, Any, Mapping, Optional
 import hashlib
+import secrets
+import stat
 import time
 
 # Import NexaClient and authentication
@@ -25,8 +34,270 @@ import sys
 import os
 sys.path.append('.')
 sys.path.append(os.path.join(os.path.dirname(__file__), 'nexadb-python'))
-from nexaclient import NexaClient  # v3.0.0 client with multi-database support
+from nexadb_client import NexaClient  # binary protocol client (multi-database, streamed queries)
 from unified_auth import UnifiedAuthManager
+from security import RateLimiter
+
+try:
+    import orjson  # C-implemented JSON encode/decode for request hot paths
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import blake3  # SIMD-accelerated hashing for API key digests
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+
+def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize a response body to compact (or indented) JSON bytes"""
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass  # e.g. non-string keys - fall back to stdlib json
+    if pretty:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def _parse_query_string(query: str) -> Dict[str, str]:
+    """
+    Parse a URL query string into {name: value}.
+
+    Lighter than parse_qs for our handful of parameters: no per-key lists,
+    and values are only unquoted when they contain escapes. Like parse_qs,
+    the first occurrence of a key wins and blank values are dropped.
+    """
+    params = {}
+    for pair in query.split('&'):
+        name, _, value = pair.partition('=')
+        if not value:
+            continue
+        if '%' in name or '+' in name:
+            name = unquote_plus(name)
+        if '%' in value or '+' in value:
+            value = unquote_plus(value)
+        params.setdefault(name, value)
+    return params
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str (raises json.JSONDecodeError)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Authenticated API keys: digest(api_key) -> (expires_at, user_info), LRU order.
+# authenticate_api_key() re-reads and re-writes users.json, so hot keys are
+# served from here; changes made by other processes apply after the TTL.
+AUTH_CACHE_SIZE = 1024
+AUTH_CACHE_TTL = 60
+_auth_cache: OrderedDict = OrderedDict()
+_auth_cache_lock = threading.Lock()
+_auth_generation = 0  # bumped on invalidation; voids per-connection auth memos
+
+# Every API key in users.json as of the given file stamp: (stamp, frozenset).
+# Unknown keys are rejected from this set without calling the auth manager.
+_known_api_keys = (None, frozenset())
+
+# Serialized bodies of idempotent GETs: path -> (created_at, write_version, bytes).
+# An entry is reused while no write has gone through this server since it was
+# built and it is younger than the TTL (which bounds staleness from writes made
+# by other clients of the binary server).
+RESPONSE_CACHE_TTL = 1.0
+_response_cache: Dict[str, tuple] = {}
+_write_version = 0
+_write_version_lock = threading.Lock()
+
+
+def _bump_write_version():
+    """
+    Invalidate cached GET responses.
+
+    Write handlers call this right after the store call and before sending
+    their response, so a client that has seen the response never gets a
+    cached body from before its write.
+    """
+    global _write_version
+    with _write_version_lock:
+        _write_version += 1
+
+# NDJSON bulk inserts are forwarded to the binary server in batches of this size
+NDJSON_BATCH_SIZE = 1000
+
+# Access-log timestamp, re-formatted only when the second changes
+_log_clock = (0, '')
+
+
+def _log_timestamp() -> str:
+    """Current time as '%Y-%m-%d %H:%M:%S' (one strftime per second)"""
+    global _log_clock
+    now = int(time.time())
+    if now != _log_clock[0]:
+        _log_clock = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return _log_clock[1]
+
+# Bodies up to this size are sent in the same write as the headers (when
+# scatter-gather sendmsg() isn't available and they have to be joined)
+COALESCE_MAX = 64 * 1024
+
+# CORS headers sent with every response, pre-encoded once
+_CORS_HEADERS = (b'Access-Control-Allow-Origin: *\r\n'
+                 b'Access-Control-Allow-Methods: GET, POST, PUT, DELETE, OPTIONS\r\n'
+                 b'Access-Control-Allow-Headers: Content-Type, X-API-Key\r\n')
+
+# GET /status never changes, so its body is serialized once
+_STATUS = {'status': 'ok', 'version': '1.0.0', 'database': 'NexaDB'}
+_STATUS_BODY = _json_dumps(_STATUS)
+
+# Client addresses treated as local (no API key required)
+_LOCALHOST = frozenset({'127.0.0.1', '::1', 'localhost'})
+
+# Result arrays with at least this many items are sent with chunked encoding
+STREAM_THRESHOLD = 1000
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# JSON bodies at least this large are gzipped for clients that accept it.
+# Level 1 is several times faster than the default and still shrinks JSON 5-10x.
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 1
+
+# Admin panel assets: relative path -> (mtime_ns, content_type, bytes), LRU order.
+# Entries are revalidated against the file's mtime on every hit; files larger
+# than ADMIN_CACHE_MAX_FILE are not cached and go out via sendfile() instead.
+ADMIN_CACHE_SIZE = 128
+ADMIN_CACHE_MAX_FILE = 1024 * 1024
+_admin_cache: OrderedDict = OrderedDict()
+_admin_cache_lock = threading.Lock()
+
+# Worker threads per REST process (--max-workers / NEXADB_MAX_WORKERS).
+# A keep-alive connection holds its thread until it closes, so this is also the
+# number of connections served at once - hence never fewer than the old 100.
+DEFAULT_MAX_WORKERS = max(100, (os.cpu_count() or 4) * 5)
+
+# Connections allowed to wait for a free worker (--queue-size / NEXADB_QUEUE_SIZE).
+# Past that, new connections get an immediate 503 instead of queueing unboundedly.
+DEFAULT_QUEUE_SIZE = 1000
+
+# listen() backlog for the REST sockets (socketserver's default is 5, which drops
+# SYNs during connection bursts). The kernel caps it at net.core.somaxconn.
+LISTEN_BACKLOG = 4096
+_OVERLOADED_RESPONSE = (b'HTTP/1.1 503 Service Unavailable\r\n'
+                        b'Content-Length: 0\r\nRetry-After: 1\r\nConnection: close\r\n\r\n')
+
+
+def _hash_api_key(api_key: str) -> bytes:
+    """Digest used to store and look up API keys (blake3, else stdlib blake2b)"""
+    if HAS_BLAKE3:
+        return blake3.blake3(api_key.encode()).digest()
+    return hashlib.blake2b(api_key.encode(), digest_size=32).digest()
+
+
+def _auth_cache_get(key_hash: bytes) -> Optional[Dict[str, Any]]:
+    """Return cached user info for a key digest, or None if missing/expired"""
+    with _auth_cache_lock:
+        entry = _auth_cache.get(key_hash)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _auth_cache[key_hash]
+            return None
+        _auth_cache.move_to_end(key_hash)
+        return entry[1]
+
+
+def _auth_cache_set(key_hash: bytes, user: Dict[str, Any]):
+    """Cache user info for a key digest, evicting the least recently used"""
+    with _auth_cache_lock:
+        _auth_cache[key_hash] = (time.monotonic() + AUTH_CACHE_TTL, user)
+        _auth_cache.move_to_end(key_hash)
+        if len(_auth_cache) > AUTH_CACHE_SIZE:
+            _auth_cache.popitem(last=False)
+
+
+def invalidate_api_key(api_key: Optional[str] = None):
+    """Drop one API key from the auth cache, or all keys if none is given"""
+    global _auth_generation
+    with _auth_cache_lock:
+        _auth_generation += 1
+        if api_key is None:
+            _auth_cache.clear()
+        else:
+            _auth_cache.pop(_hash_api_key(api_key), None)
+
+
+class ThreadedHTTPServer(HTTPServer):
+    """
+    HTTP server that handles requests on a bounded worker pool.
+
+    Plain HTTPServer serves one request at a time, so a slow query blocks
+    every other client. Requests are handed to a ThreadPoolExecutor instead
+    of a thread per connection, which caps thread count under floods.
+    At most max_workers + queue_size connections are admitted at once; the
+    rest are answered with 503 straight from the accept loop.
+    """
+
+    allow_reuse_address = True
+    request_queue_size = LISTEN_BACKLOG
+
+    def __init__(self, server_address, handler_class, max_workers: int = DEFAULT_MAX_WORKERS,
+                 queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='nexadb-http')
+        self.max_pending = max_workers + queue_size
+        self.pending = 0  # connections submitted and not yet finished
+        self.pending_lock = threading.Lock()
+        self.rejected_connections = 0  # only touched by the accept loop
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self):
+        """Allow several server processes to share the port (where supported)"""
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def process_request(self, request, client_address):
+        """Hand the connection to the worker pool, or reject it if saturated"""
+        with self.pending_lock:
+            admitted = self.pending < self.max_pending
+            if admitted:
+                self.pending += 1
+        if not admitted:
+            self.rejected_connections += 1
+            try:
+                request.sendall(_OVERLOADED_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        self.executor.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        """Serve one connection on a pool thread"""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self.pending_lock:
+                self.pending -= 1
+
+    # Set in --workers processes: stop serving once the parent process is gone
+    parent_pid: Optional[int] = None
+
+    def service_actions(self):
+        """Called by serve_forever() about twice a second"""
+        super().service_actions()
+        if self.parent_pid is not None and os.getppid() != self.parent_pid:
+            raise SystemExit(0)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False)
 
 
 class NexaDBHandler(BaseHTTPRequestHandler):
@@ -34,22 +305,109 @@ class NexaDBHandler(BaseHTTPRequestHandler):
 
     # Class-level client instance (connects to binary server - THE SOURCE OF TRUTH)
     client: NexaClient = None
+    binary_host = 'localhost'
+    binary_port = 6970
     auth: UnifiedAuthManager = None  # Unified authentication manager
-    api_keys: Dict[str, str] = {}  # api_key -> username (for backward compatibility)
+    rate_limiter: RateLimiter = RateLimiter(default_rate=1000, default_burst=2000)  # per API-key user
+    # digest(api_key) -> username (for backward compatibility). Read-only view,
+    # replaced wholesale on change so request threads read it without a lock.
+    api_keys: Mapping[bytes, str] = MappingProxyType({})
+    _api_keys_write_lock = threading.Lock()
+
+    # Keep connections open between requests; idle keep-alive sockets are
+    # dropped after `timeout` seconds so they don't pin pool workers
+    protocol_version = 'HTTP/1.1'
+    timeout = 30
+    _unread_body = False  # request body not consumed (connection can't be reused)
+    _pretty = False  # ?pretty=1: indent JSON responses for humans
+    # Send headers + body with one sendmsg() (writev) straight from their buffers
+    _scatter_writes = hasattr(socket.socket, 'sendmsg')
+
+    # (api_key, user, expires_at, auth generation) of the last key authenticated
+    # on this connection - handler instances live as long as the connection
+    _auth_memo = None
+
+    # Role hierarchy for _check_permission: guest < read < write < admin
+    ROLE_LEVELS = {'guest': 0, 'read': 1, 'write': 2, 'admin': 3}
+
+    # Admin panel static files
+    _ADMIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), 'admin_panel'))
+    _CONTENT_TYPES = {
+        '.html': 'text/html',
+        '.css': 'text/css',
+        '.js': 'application/javascript',
+        '.json': 'application/json',
+        '.png': 'image/png',
+        '.jpg': 'image/jpeg',
+        '.jpeg': 'image/jpeg',
+        '.gif': 'image/gif',
+        '.svg': 'image/svg+xml',
+        '.ico': 'image/x-icon'
+    }
+
+    def setup(self):
+        """Disable Nagle so small JSON responses are sent immediately"""
+        super().setup()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _set_headers(self, status_code: int = 200, content_type: str = 'application/json',
+                     content_length: Optional[int] = 0, body: Optional[bytes] = None,
+                     content_encoding: Optional[str] = None):
+        """
+        Set response headers (content_length=None sends a chunked body).
 
-    def _set_headers(self, status_code: int = 200, content_type: str = 'application/json'):
-        """Set response headers"""
+        If body is given it is sent too - in the same write as the headers, so
+        the response costs one send() instead of two. With sendmsg() the
+        header and body buffers are handed to the kernel as they are; the body
+        is never copied into a joined response buffer.
+        """
+        if body is not None:
+            content_length = len(body)
         self.send_response(status_code)
         self.send_header('Content-Type', content_type)
-        self.send_header('Access-Control-Allow-Origin', '*')  # CORS
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, X-API-Key')
+        if content_encoding:
+            self.send_header('Content-Encoding', content_encoding)
+            self.send_header('Vary', 'Accept-Encoding')
+        if content_length is None:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Content-Length', str(content_length))
+        if self._unread_body:
+            # Leftover body bytes would be parsed as the next request
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        elif self.request_version == 'HTTP/1.0' and self.headers.get('Connection', '').lower() == 'keep-alive':
+            # HTTP/1.0 clients (e.g. ab -k) only reuse the connection if told so
+            self.send_header('Connection', 'keep-alive')
+        self._headers_buffer.append(_CORS_HEADERS)
+        if body is not None and self._scatter_writes:
+            self._headers_buffer.append(b'\r\n')
+            self._headers_buffer.append(body)
+            buffers, self._headers_buffer = self._headers_buffer, []
+            self._sendmsg_all(buffers)
+            return
+        if body is not None and len(body) <= COALESCE_MAX:
+            self._headers_buffer.append(b'\r\n')
+            self._headers_buffer.append(body)
+            self.flush_headers()
+            return
         self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _sendmsg_all(self, buffers: list):
+        """Write all buffers to the socket, resuming after partial sends"""
+        views = [memoryview(buf) for buf in buffers]
+        while views:
+            sent = self.connection.sendmsg(views)
+            while views and sent >= views[0].nbytes:
+                sent -= views.pop(0).nbytes
+            if sent:
+                views[0] = views[0][sent:]
 
     def _is_localhost(self) -> bool:
         """Check if request is from localhost"""
-        client_ip = self.client_address[0]
-        return client_ip in ('127.0.0.1', '::1', 'localhost')
+        return self.client_address[0] in _LOCALHOST
 
     def _authenticate(self) -> Optional[Dict[str, Any]]:
         """
@@ -64,14 +422,33 @@ class NexaDBHandler(BaseHTTPRequestHandler):
         api_key = self.headers.get('X-API-Key')
 
         if api_key:
+            # Same key as the previous request on this keep-alive connection
+            memo = self._auth_memo
+            if (memo and memo[0] == api_key and memo[3] == _auth_generation
+                    and memo[2] > time.monotonic()):
+                return memo[1]
+
+            generation = _auth_generation
+            key_hash = _hash_api_key(api_key)
+            user = _auth_cache_get(key_hash)
+            if user:
+                self._auth_memo = (api_key, user, time.monotonic() + AUTH_CACHE_TTL, generation)
+                return user
+
             # Use UnifiedAuthManager to validate API key
             if self.auth:
-                return self.auth.authenticate_api_key(api_key)
+                if not self._is_known_api_key(api_key):
+                    return None
+                user = self.auth.authenticate_api_key(api_key)
+            else:
+                # Fallback to legacy api_keys dict
+                username = self.api_keys.get(key_hash)
+                user = {'username': username, 'role': 'admin'} if username else None
 
-            # Fallback to legacy api_keys dict
-            username = self.api_keys.get(api_key)
-            if username:
-                return {'username': username, 'role': 'admin'}
+            if user:
+                _auth_cache_set(key_hash, user)
+                self._auth_memo = (api_key, user, time.monotonic() + AUTH_CACHE_TTL, generation)
+            return user
 
         # Allow localhost without API key (for development only)
         if self._is_localhost() and not api_key:
@@ -79,11 +456,145 @@ class NexaDBHandler(BaseHTTPRequestHandler):
 
         return None
 
+    def _is_known_api_key(self, api_key: str) -> bool:
+        """
+        O(1) check that api_key exists in users.json.
+
+        authenticate_api_key() reloads users.json (and rewrites it on success),
+        so bad keys would otherwise cost a full disk read each. The key set is
+        rebuilt only when the file changes (save_users() replaces it, so the
+        inode changes on every save).
+        """
+        global _known_api_keys
+        try:
+            st = os.stat(self.auth.users_file)
+            stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if stamp is None or stamp != _known_api_keys[0]:
+            self.auth.load_users()
+            keys = frozenset(user['api_key'] for user in self.auth.users.values() if 'api_key' in user)
+            _known_api_keys = (stamp, keys)
+        return api_key in _known_api_keys[1]
+
+    def _accepts_gzip(self) -> bool:
+        """Whether the client sent Accept-Encoding: gzip (without q=0)"""
+        accept = self.headers.get('Accept-Encoding')
+        if not accept or 'gzip' not in accept:
+            return False
+        for coding in accept.split(','):
+            name, _, q = coding.partition(';')
+            if name.strip() == 'gzip':
+                return q.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+        return False
+
+    def _send_body(self, status_code: int, body: bytes):
+        """Send a JSON body, gzipped when it is large and the client accepts it"""
+        if len(body) >= GZIP_MIN_SIZE and self._accepts_gzip():
+            self._set_headers(status_code, body=gzip.compress(body, GZIP_LEVEL), content_encoding='gzip')
+        else:
+            self._set_headers(status_code, body=body)
+
     def _send_json(self, data: Any, status_code: int = 200):
-        """Send JSON response"""
-        self._set_headers(status_code)
-        response = json.dumps(data, indent=2)
-        self.wfile.write(response.encode())
+        """Send JSON response (indented if the request had ?pretty=1)"""
+        self._send_body(status_code, _json_dumps(data, self._pretty))
+
+    def _send_json_stream(self, data: Dict[str, Any], array_key: str, status_code: int = 200):
+        """
+        Send JSON response, encoding the data[array_key] list incrementally.
+
+        Large result sets are written as ~64KB HTTP chunks while they are
+        encoded, so the full response body never exists in memory at once
+        and the client starts receiving data early. Small results (and
+        HTTP/1.0 clients, which can't take chunked bodies) use _send_json.
+        """
+        items = data[array_key]
+        if len(items) < STREAM_THRESHOLD or self.request_version != 'HTTP/1.1' or self._pretty:
+            self._send_json(data, status_code)
+            return
+
+        compressor = self._begin_chunked(status_code)
+        head = _json_dumps({k: v for k, v in data.items() if k != array_key})
+        buf = bytearray(head[:-1])  # reopen the object: {"status":...
+        buf += b',"%s":[' % array_key.encode()
+        for i, item in enumerate(items):
+            if i:
+                buf += b','
+            buf += _json_dumps(item)
+            if len(buf) >= STREAM_CHUNK_SIZE:
+                self._write_chunk(buf, compressor)
+                buf.clear()
+        buf += b']}'
+        self._end_chunked(buf, compressor)
+
+    def _send_query_results(self, collection_name: str, query: Dict[str, Any], limit: int,
+                            database: Optional[str] = None):
+        """
+        Run a query and send {status, collection, documents, count}.
+
+        Queries with limit >= STREAM_THRESHOLD are streamed end to end: each
+        chunk the binary server streams back is encoded and written as an HTTP
+        chunk, so no full result list is ever built here. iter_query() runs
+        each stream on its own (pooled) binary-server connection, so a slow
+        HTTP reader never holds up requests on the shared client.
+        """
+        if not isinstance(limit, int) or limit < STREAM_THRESHOLD or self.request_version != 'HTTP/1.1' or self._pretty:
+            documents = self.client.query(collection_name, query, limit=limit, database=database)
+            self._send_json_stream({
+                'status': 'success',
+                'collection': collection_name,
+                'documents': documents,
+                'count': len(documents)
+            }, 'documents')
+            return
+
+        documents = self.client.iter_query(collection_name, query, limit=limit, database=database)
+        try:
+            first = next(documents, None)  # query errors surface before any headers are sent
+            compressor = self._begin_chunked(200)
+            buf = bytearray(b'{"status":"success","collection":%s,"documents":[' % _json_dumps(collection_name))
+            count = 0
+            if first is not None:
+                buf += _json_dumps(first)
+                count = 1
+                for document in documents:
+                    buf += b','
+                    buf += _json_dumps(document)
+                    count += 1
+                    if len(buf) >= STREAM_CHUNK_SIZE:
+                        self._write_chunk(buf, compressor)
+                        buf.clear()
+            buf += b'],"count":%d}' % count
+            self._end_chunked(buf, compressor)
+        finally:
+            documents.close()  # frees the stream's connection, even if the HTTP client went away
+
+    def _begin_chunked(self, status_code: int = 200):
+        """
+        Send headers for a chunked JSON body.
+
+        Returns a compressor (gzip container format, applied as the chunks are
+        produced) if the client accepts gzip, else None.
+        """
+        compressor = zlib.compressobj(GZIP_LEVEL, wbits=31) if self._accepts_gzip() else None
+        self._set_headers(status_code, content_length=None,
+                          content_encoding='gzip' if compressor else None)
+        return compressor
+
+    def _write_chunk(self, data: bytes, compressor=None):
+        """Write one chunk of a Transfer-Encoding: chunked body"""
+        if compressor:
+            data = compressor.compress(data)
+        if not data:
+            return  # a zero-length chunk would end the body
+        self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+
+    def _end_chunked(self, data: bytes, compressor=None):
+        """Write the last data chunk and the terminating zero-length chunk"""
+        if compressor:
+            data = compressor.compress(data) + compressor.flush()
+        self._write_chunk(data)
+        self.wfile.write(b'0\r\n\r\n')
 
     def _send_error(self, message: str, status_code: int = 400):
         """Send error response"""
@@ -102,84 +613,94 @@ class NexaDBHandler(BaseHTTPRequestHandler):
         Returns:
             True if user has permission, False otherwise
         """
-        role_hierarchy = {
-            'guest': 0,
-            'read': 1,
-            'write': 2,
-            'admin': 3
-        }
-
-        user_level = role_hierarchy.get(user.get('role', 'guest'), 0)
-        required_level = role_hierarchy.get(required_role, 3)
-
-        return user_level >= required_level
+        return self.ROLE_LEVELS.get(user.get('role'), 0) >= self.ROLE_LEVELS.get(required_role, 3)
 
     def _parse_body(self) -> Optional[Dict[str, Any]]:
         """Parse JSON request body"""
         content_length = int(self.headers.get('Content-Length', 0))
+        self._unread_body = False
         if content_length == 0:
             return {}
 
-        body = self.rfile.read(content_length)
+        # Read straight into one preallocated buffer; both JSON parsers
+        # accept a bytearray, so the body is never copied or decoded
+        body = bytearray(content_length)
+        view = memoryview(body)
+        received = 0
+        while received < content_length:
+            n = self.rfile.readinto(view[received:])
+            if not n:
+                return None  # client closed before sending the full body
+            received += n
+        view.release()
+
         try:
-            return json.loads(body.decode())
+            return _json_loads(body)
         except json.JSONDecodeError:
             return None
 
-    def _serve_admin_panel(self, path: str):
-        """Serve admin panel static files"""
-        import os
-
-        # Remove /admin_panel prefix
-        file_path = path.replace('/admin_panel', '', 1)
-
+    def _serve_admin_panel(self, file_path: str):
+        """Serve admin panel static files (file_path: request path after /admin_panel)"""
         # Default to index.html
         if file_path == '' or file_path == '/':
             file_path = '/index.html'
 
         # Construct full path
-        admin_dir = os.path.join(os.path.dirname(__file__), 'admin_panel')
-        full_path = os.path.join(admin_dir, file_path.lstrip('/'))
+        full_path = os.path.normpath(os.path.join(self._ADMIN_DIR, file_path.lstrip('/')))
 
         # Security: Prevent directory traversal
-        if not os.path.abspath(full_path).startswith(os.path.abspath(admin_dir)):
+        if not full_path.startswith(self._ADMIN_DIR + os.sep):
             self._send_error('Forbidden', 403)
             return
 
-        # Check if file exists
-        if not os.path.isfile(full_path):
+        # Check if file exists (its mtime also validates cached content)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             self._send_error('File not found', 404)
             return
 
-        # Determine content type
-        content_types = {
-            '.html': 'text/html',
-            '.css': 'text/css',
-            '.js': 'application/javascript',
-            '.json': 'application/json',
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.svg': 'image/svg+xml',
-            '.ico': 'image/x-icon'
-        }
+        with _admin_cache_lock:
+            entry = _admin_cache.get(full_path)
+            if entry is not None and entry[0] == st.st_mtime_ns:
+                _admin_cache.move_to_end(full_path)
+            else:
+                entry = None
+        if entry is not None:
+            self._set_headers(200, entry[1], body=entry[2])
+            return
 
+        # Determine content type
         _, ext = os.path.splitext(full_path)
-        content_type = content_types.get(ext.lower(), 'text/plain')
+        content_type = self._CONTENT_TYPES.get(ext.lower(), 'text/plain')
 
         # Read and serve file
         try:
             with open(full_path, 'rb') as f:
+                if st.st_size > ADMIN_CACHE_MAX_FILE and hasattr(self, 'connection'):
+                    # Large file: let the kernel copy it straight to the socket
+                    self._set_headers(200, content_type, content_length=st.st_size)
+                    self.wfile.flush()
+                    self.connection.sendfile(f, 0, st.st_size)
+                    return
                 content = f.read()
 
-            self._set_headers(200, content_type)
-            self.wfile.write(content)
+            if len(content) <= ADMIN_CACHE_MAX_FILE:
+                with _admin_cache_lock:
+                    _admin_cache[full_path] = (st.st_mtime_ns, content_type, content)
+                    _admin_cache.move_to_end(full_path)
+                    if len(_admin_cache) > ADMIN_CACHE_SIZE:
+                        _admin_cache.popitem(last=False)
+
+            self._set_headers(200, content_type, body=content)
         except Exception as e:
             self._send_error(f'Error reading file: {str(e)}', 500)
 
     def do_OPTIONS(self):
         """Handle CORS preflight"""
+        self._unread_body = self.headers.get('Content-Length', '0') != '0'
         self._set_headers()
 
     def do_GET(self):
@@ -192,541 +713,656 @@ class NexaDBHandler(BaseHTTPRequestHandler):
         - GET /collections/{name} - List documents
         - GET /collections/{name}/{id} - Get document by ID
         - GET /stats - Database statistics
+        - GET /users - List users (admin only)
         - GET /admin_panel/* - Serve admin panel files
         """
-        parsed = urlparse(self.path)
-        path = parsed.path
-        params = parse_qs(parsed.query)
+        self._dispatch('GET')
+
+    def do_POST(self):
+        """
+        Handle POST requests
+
+        Endpoints:
+        - POST /auth/login - Login with username/password
+        - POST /collections/{name} - Insert document
+        - POST /collections/{name}/bulk - Insert many documents (JSON or application/x-ndjson)
+        - POST /collections/{name}/query - Complex query
+        - POST /collections/{name}/aggregate - Aggregation pipeline
+        - POST /vector/{name}/search - Vector similarity search
+        - POST /users/create - Create user (admin only)
+        """
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        """
+        Handle PUT requests
+
+        Endpoints:
+        - PUT /collections/{name}/{id} - Update document
+        - PUT /databases/{db}/collections/{name}/documents/{id} - Update document
+        - PUT /users/{username} - Update user (admin only)
+        """
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        """
+        Handle DELETE requests
+
+        Endpoints:
+        - DELETE /collections/{name} - Drop collection
+        - DELETE /collections/{name}/{id} - Delete document
+        - DELETE /databases/{db}/collections/{name}/documents/{id} - Delete document
+        - DELETE /users/{username} - Delete user (admin only)
+        """
+        self._dispatch('DELETE')
+
+    def _dispatch(self, method: str):
+        """
+        Route a request through the STATIC_ROUTES / ROUTES tables.
+
+        Fixed paths are matched by (method, path). Parameterized paths are
+        matched by (method, segment count, first segment, third segment),
+        falling back to '*' for a variable third segment (e.g. a document ID).
+        """
+        # Origin-form request target: split once instead of urlparse()
+        path, _, query = self.path.partition('?')
+        path = path.partition('#')[0]
+        self._unread_body = self.headers.get('Content-Length', '0') != '0'
+        params = _parse_query_string(query.partition('#')[0]) if query else {}
+        self._pretty = params.get('pretty') in ('1', 'true')
 
         # Serve admin panel files
-        if path.startswith('/admin_panel'):
-            self._serve_admin_panel(path)
+        if method == 'GET' and path[:12] == '/admin_panel':
+            self._serve_admin_panel(path[12:])
             return
 
-        # Status endpoint (no auth required)
-        if path == '/status':
-            self._send_json({
-                'status': 'ok',
-                'version': '1.0.0',
-                'database': 'NexaDB'
-            })
-            return
+        parts = path.strip('/').split('/')
+        handler = self.STATIC_ROUTES.get((method, path))
+        if handler is None:
+            n = len(parts)
+            key = (method, n, parts[0], parts[2] if n >= 3 else None)
+            handler = self.ROUTES.get(key)
+            if handler is None and n >= 3:
+                handler = self.ROUTES.get(key[:3] + ('*',))
+
+        # Status and login endpoints need no authentication
+        user = None
+        if (method, path) not in self.PUBLIC_ROUTES:
+            user = self._authenticate()
+            if not user:
+                self._send_error('Unauthorized - provide X-API-Key header', 401)
+                return
 
-        # Require authentication for other endpoints
-        user = self._authenticate()
-        if not user:
-            self._send_error('Unauthorized - provide X-API-Key header', 401)
+            # Token bucket per API-key user (keyless localhost dev access is exempt)
+            if 'X-API-Key' in self.headers and not self.rate_limiter.allow(user['username'])[0]:
+                self._send_error('Rate limit exceeded - slow down', 429)
+                return
+
+        if handler is None:
+            self._send_error('Endpoint not found', 404)
             return
 
-        # List collections
-        if path == '/collections':
+        body = None
+        if handler in self.NDJSON_ROUTES and self.headers.get('Content-Type', '').startswith('application/x-ndjson'):
+            pass  # handler streams the body itself
+        elif method in ('POST', 'PUT'):
+            body = self._parse_body()
+            if body is None:
+                self._send_error('Invalid JSON body', 400)
+                return
+
+        if method == 'GET':
+            handler(self, user, parts, params, body)
+            return
+        try:
+            handler(self, user, parts, params, body)
+        except Exception:
+            _bump_write_version()  # a failed write may still have been applied
+            raise
+
+    # ------------------------------------------------------------------
+    # GET handlers
+    # ------------------------------------------------------------------
+
+    def _send_cached_json(self, key: str, build):
+        """Send build()'s JSON, reusing the serialized body from _response_cache"""
+        if self._pretty:
+            self._send_json(build())
+            return
+        now = time.monotonic()
+        entry = _response_cache.get(key)
+        if entry and entry[1] == _write_version and now - entry[0] < RESPONSE_CACHE_TTL:
+            response = entry[2]
+        else:
+            version = _write_version  # read before building, so a racing write invalidates it
+            response = _json_dumps(build())
+            _response_cache[key] = (now, version, response)
+
+        self._send_body(200, response)
+
+    def _get_status(self, user, parts, params, body):
+        """GET /status"""
+        if self._pretty:
+            self._send_json(_STATUS)
+        else:
+            self._send_body(200, _STATUS_BODY)
+
+    def _get_collections(self, user, parts, params, body):
+        """GET /collections"""
+        def build():
             collections = self.client.list_collections()
-            self._send_json({
+            return {
                 'status': 'success',
                 'collections': collections,
                 'count': len(collections)
-            })
-            return
-
-        # Stats (TODO: Add to binary protocol)
-        if path == '/stats':
-            # Note: stats() needs to be added to binary protocol/NexaClient
-            self._send_json({
-                'status': 'success',
-                'message': 'Stats endpoint will be available in next version',
-                'stats': {
-                    'collections': len(self.client.list_collections()),
-                    'version': '2.2.1'
-                }
-            })
+            }
+        self._send_cached_json('/collections', build)
+
+    def _get_stats(self, user, parts, params, body):
+        """GET /stats (TODO: Add to binary protocol)"""
+        # Note: stats() needs to be added to binary protocol/NexaClient
+        self._send_cached_json('/stats', lambda: {
+            'status': 'success',
+            'message': 'Stats endpoint will be available in next version',
+            'stats': {
+                'collections': len(self.client.list_collections()),
+                'version': '2.2.1'
+            }
+        })
+
+    def _get_documents(self, user, parts, params, body):
+        """GET /collections/{name}"""
+        collection_name = parts[1]
+
+        # Parse query parameters
+        try:
+            query = _json_loads(params['query']) if 'query' in params else {}
+        except json.JSONDecodeError:
+            self._send_error('Invalid JSON in query parameter', 400)
             return
+        limit = int(params.get('limit', 100))
+        database = params.get('database')  # v3.0.0: Extract database parameter
 
-        # Get documents from collection
-        parts = path.strip('/').split('/')
-        if len(parts) == 2 and parts[0] == 'collections':
-            collection_name = parts[1]
+        # Query via NexaClient (connects to binary server)
+        self._send_query_results(collection_name, query, limit, database)
 
-            # Parse query parameters
-            query = json.loads(params.get('query', ['{}'])[0])
-            limit = int(params.get('limit', [100])[0])
-            database = params.get('database', [None])[0]  # v3.0.0: Extract database parameter
+    def _get_document(self, user, parts, params, body):
+        """GET /collections/{name}/{id}"""
+        collection_name = parts[1]
+        doc_id = parts[2]
 
-            # Query via NexaClient (connects to binary server)
-            documents = self.client.query(collection_name, query, limit=limit, database=database)
+        # Get via NexaClient (connects to binary server)
+        document = self.client.get(collection_name, doc_id)
 
+        if document:
             self._send_json({
                 'status': 'success',
-                'collection': collection_name,
-                'documents': documents,
-                'count': len(documents)
+                'document': document
             })
+        else:
+            self._send_error('Document not found', 404)
+
+    def _get_users(self, user, parts, params, body):
+        """GET /users (admin only)"""
+        # Check if user is admin
+        if user['role'] != 'admin':
+            self._send_error('Permission denied. Only admins can list users.', 403)
             return
 
-        # Get document by ID
-        if len(parts) == 3 and parts[0] == 'collections':
-            collection_name = parts[1]
-            doc_id = parts[2]
-
-            # Get via NexaClient (connects to binary server)
-            document = self.client.get(collection_name, doc_id)
-
-            if document:
-                self._send_json({
-                    'status': 'success',
-                    'document': document
-                })
-            else:
-                self._send_error('Document not found', 404)
+        if not self.auth:
+            self._send_error('Authentication system not initialized', 500)
             return
 
-        # List users (admin only)
-        if path == '/users':
-            # Check if user is admin
-            if user['role'] != 'admin':
-                self._send_error('Permission denied. Only admins can list users.', 403)
-                return
+        users_dict = self.auth.list_users()
+
+        # Convert dict to array format for frontend
+        users_array = []
+        for username, user_data in users_dict.items():
+            users_array.append({
+                'username': username,
+                'role': user_data.get('role', 'guest'),
+                'api_key': user_data.get('api_key_prefix', 'N/A'),
+                'created_at': user_data.get('created_at', 0),
+                'last_login': user_data.get('last_login')
+            })
 
-            if not self.auth:
-                self._send_error('Authentication system not initialized', 500)
-                return
+        self._send_json({
+            'status': 'success',
+            'users': users_array,
+            'count': len(users_array)
+        })
 
-            users_dict = self.auth.list_users()
+    # ------------------------------------------------------------------
+    # POST handlers
+    # ------------------------------------------------------------------
 
-            # Convert dict to array format for frontend
-            users_array = []
-            for username, user_data in users_dict.items():
-                users_array.append({
-                    'username': username,
-                    'role': user_data.get('role', 'guest'),
-                    'api_key': user_data.get('api_key_prefix', 'N/A'),
-                    'created_at': user_data.get('created_at', 0),
-                    'last_login': user_data.get('last_login')
-                })
+    def _post_login(self, user, parts, params, body):
+        """POST /auth/login"""
+        username = body.get('username')
+        password = body.get('password')
 
-            self._send_json({
-                'status': 'success',
-                'users': users_array,
-                'count': len(users_array)
-            })
+        if not username or not password:
+            self._send_error('Missing username or password', 400)
             return
 
-        self._send_error('Endpoint not found', 404)
-
-    def do_POST(self):
-        """
-        Handle POST requests
+        if not self.auth:
+            self._send_error('Authentication system not initialized', 500)
+            return
 
-        Endpoints:
-        - POST /auth/login - Login with username/password
-        - POST /collections/{name} - Insert document
-        - POST /collections/{name}/bulk - Insert many documents
-        - POST /collections/{name}/query - Complex query
-        - POST /collections/{name}/aggregate - Aggregation pipeline
-        - POST /vector/{name}/search - Vector similarity search
-        """
-        parsed = urlparse(self.path)
-        path = parsed.path
-        parts = path.strip('/').split('/')
+        # Authenticate with username/password
+        user_info = self.auth.authenticate_password(username, password)
 
-        body = self._parse_body()
-        if body is None:
-            self._send_error('Invalid JSON body', 400)
+        if not user_info:
+            self._send_error('Invalid username or password', 401)
             return
 
-        # Login endpoint (no authentication required)
-        if path == '/auth/login':
-            username = body.get('username')
-            password = body.get('password')
+        # Return user info with API key
+        self._send_json({
+            'status': 'success',
+            'message': 'Login successful',
+            'username': user_info['username'],
+            'role': user_info['role'],
+            'api_key': user_info['api_key']
+        })
+
+    def _post_document(self, user, parts, params, body):
+        """POST /collections/{name} (requires write permission)"""
+        # Check write permission
+        if not self._check_permission(user, 'write'):
+            self._send_error('Permission denied. Write access required to insert documents.', 403)
+            return
 
-            if not username or not password:
-                self._send_error('Missing username or password', 400)
-                return
+        collection_name = parts[1]
 
-            if not self.auth:
-                self._send_error('Authentication system not initialized', 500)
-                return
+        # Extract database parameter from query string (v3.0.0)
+        database = params.get('database')
 
-            # Authenticate with username/password
-            user_info = self.auth.authenticate_password(username, password)
+        # Create via NexaClient (connects to binary server)
+        result = self.client.create(collection_name, body, database=database)
+        _bump_write_version()
+        doc_id = result['document_id']
 
-            if not user_info:
-                self._send_error('Invalid username or password', 401)
-                return
+        self._send_json({
+            'status': 'success',
+            'collection': collection_name,
+            'document_id': doc_id,
+            'message': 'Document inserted'
+        }, 201)
 
-            # Return user info with API key
-            self._send_json({
-                'status': 'success',
-                'message': 'Login successful',
-                'username': user_info['username'],
-                'role': user_info['role'],
-                'api_key': user_info['api_key']
-            })
+    def _post_bulk(self, user, parts, params, body):
+        """POST /collections/{name}/bulk (requires write permission)"""
+        # Check write permission
+        if not self._check_permission(user, 'write'):
+            self._send_error('Permission denied. Write access required to insert documents.', 403)
             return
 
-        # Require authentication for other endpoints
-        user = self._authenticate()
-        if not user:
-            self._send_error('Unauthorized - provide X-API-Key header', 401)
-            return
+        collection_name = parts[1]
 
-        # Insert document (requires write permission)
-        if len(parts) == 2 and parts[0] == 'collections':
-            # Check write permission
-            if not self._check_permission(user, 'write'):
-                self._send_error('Permission denied. Write access required to insert documents.', 403)
+        if body is None:
+            # application/x-ndjson: one document per line
+            doc_ids = self._bulk_insert_ndjson(collection_name)
+            if doc_ids is None:
                 return
+        else:
+            documents = body.get('documents', [])
+
+            # Batch write via NexaClient (connects to binary server)
+            result = self.client.batch_write(collection_name, documents)
+            _bump_write_version()
+            doc_ids = result.get('document_ids', [])
 
-            collection_name = parts[1]
+        self._send_json({
+            'status': 'success',
+            'collection': collection_name,
+            'document_ids': doc_ids,
+            'count': len(doc_ids),
+            'message': f'Inserted {len(doc_ids)} documents'
+        }, 201)
 
-            # Extract database parameter from query string (v3.0.0)
-            params = parse_qs(parsed.query)
-            database = params.get('database', [None])[0]
+    def _bulk_insert_ndjson(self, collection_name: str) -> Optional[list]:
+        """
+        Insert an NDJSON request body, parsing it line by line.
 
-            # Create via NexaClient (connects to binary server)
-            result = self.client.create(collection_name, body, database=database)
-            doc_id = result['document_id']
+        Documents are sent to the binary server every NDJSON_BATCH_SIZE lines,
+        so only one batch of parsed documents is held in memory instead of the
+        whole payload plus its parsed list.
 
-            self._send_json({
-                'status': 'success',
-                'collection': collection_name,
-                'document_id': doc_id,
-                'message': 'Document inserted'
-            }, 201)
+        Returns: inserted document IDs, or None after sending an error response
+        """
+        remaining = int(self.headers.get('Content-Length', 0))
+        doc_ids = []
+        batch = []
+        line_number = 0
+
+        while remaining > 0:
+            line = self.rfile.readline(remaining)
+            if not line:
+                break  # client closed before sending the full body
+            remaining -= len(line)
+            line_number += 1
+            if not line.strip():
+                continue
+
+            try:
+                document = _json_loads(line)
+            except json.JSONDecodeError:
+                document = None
+            if not isinstance(document, dict):
+                self._send_error(f'Invalid JSON document on line {line_number} '
+                                 f'({len(doc_ids)} documents inserted before it)', 400)
+                return None
+
+            batch.append(document)
+            if len(batch) >= NDJSON_BATCH_SIZE:
+                doc_ids.extend(self.client.batch_write(collection_name, batch).get('document_ids', []))
+                _bump_write_version()
+                batch = []
+
+        if batch:
+            doc_ids.extend(self.client.batch_write(collection_name, batch).get('document_ids', []))
+            _bump_write_version()
+        self._unread_body = remaining > 0
+        return doc_ids
+
+    def _post_query(self, user, parts, params, body):
+        """POST /collections/{name}/query"""
+        collection_name = parts[1]
+        query = body.get('query', {})
+        limit = body.get('limit', 100)
+
+        # Query via NexaClient (connects to binary server)
+        self._send_query_results(collection_name, query, limit)
+
+    def _post_aggregate(self, user, parts, params, body):
+        """POST /collections/{name}/aggregate (TODO: Add to binary protocol)"""
+        # Note: Aggregation needs to be added to binary protocol/NexaClient
+        self._send_json({
+            'status': 'error',
+            'message': 'Aggregation endpoint will be available in next version. Use /query for now.'
+        }, 501)  # 501 Not Implemented
+
+    def _post_vector_search(self, user, parts, params, body):
+        """POST /vector/{name}/search"""
+        collection_name = parts[1]
+        vector = body.get('vector', [])
+        limit = body.get('limit', 10)
+        dimensions = body.get('dimensions', 768)
+        database = body.get('database')  # v3.0.0: Extract database parameter from body
+
+        # Vector search via NexaClient (connects to binary server)
+        results = self.client.vector_search(collection_name, vector, limit=limit, dimensions=dimensions, database=database)
+
+        self._send_json_stream({
+            'status': 'success',
+            'collection': collection_name,
+            'results': results,
+            'count': len(results)
+        }, 'results')
+
+    def _post_create_user(self, user, parts, params, body):
+        """POST /users/create (admin only)"""
+        # Check if user is admin
+        if user['role'] != 'admin':
+            self._send_error('Permission denied. Only admins can create users.', 403)
             return
 
-        # Bulk insert (requires write permission)
-        if len(parts) == 3 and parts[0] == 'collections' and parts[2] == 'bulk':
-            # Check write permission
-            if not self._check_permission(user, 'write'):
-                self._send_error('Permission denied. Write access required to insert documents.', 403)
-                return
+        username = body.get('username')
+        password = body.get('password')
+        role = body.get('role', 'read')
 
-            collection_name = parts[1]
-            documents = body.get('documents', [])
+        if not username or not password:
+            self._send_error('Missing username or password', 400)
+            return
 
-            # Batch write via NexaClient (connects to binary server)
-            result = self.client.batch_write(collection_name, documents)
-            doc_ids = result.get('document_ids', [])
+        try:
+            api_key = self.auth.create_user(username, password, role)
 
             self._send_json({
                 'status': 'success',
-                'collection': collection_name,
-                'document_ids': doc_ids,
-                'count': len(doc_ids),
-                'message': f'Inserted {len(doc_ids)} documents'
+                'message': f"User '{username}' created successfully",
+                'username': username,
+                'password': password,  # Return so admin can give it to the user
+                'api_key': api_key,    # Return so admin can give it to the user
+                'role': role,
+                'note': '⚠️ Save these credentials! Password and API key are only shown once.'
             }, 201)
+        except ValueError as e:
+            self._send_error(str(e), 400)
+
+    # ------------------------------------------------------------------
+    # PUT handlers
+    # ------------------------------------------------------------------
+
+    def _put_database_document(self, user, parts, params, body):
+        """PUT /databases/{database}/collections/{collection}/documents/{id} (v3.0.0)"""
+        if parts[4] != 'documents':
+            self._send_error('Endpoint not found', 404)
             return
 
-        # Query
-        if len(parts) == 3 and parts[0] == 'collections' and parts[2] == 'query':
-            collection_name = parts[1]
-            query = body.get('query', {})
-            limit = body.get('limit', 100)
+        # Check write permission
+        if not self._check_permission(user, 'write'):
+            self._send_error('Permission denied. Write access required to update documents.', 403)
+            return
 
-            # Query via NexaClient (connects to binary server)
-            documents = self.client.query(collection_name, query, limit=limit)
+        database = parts[1]
+        collection_name = parts[3]
+        doc_id = parts[5]
 
+        try:
+            # Update via NexaClient (connects to binary server)
+            result = self.client.update(collection_name, doc_id, body, database=database)
+            _bump_write_version()
             self._send_json({
                 'status': 'success',
                 'collection': collection_name,
-                'documents': documents,
-                'count': len(documents)
+                'document_id': doc_id,
+                'message': 'Document updated'
             })
-            return
+        except Exception as e:
+            self._send_error(f'Document not found or update failed: {str(e)}', 404)
 
-        # Aggregation (TODO: Add to binary protocol)
-        if len(parts) == 3 and parts[0] == 'collections' and parts[2] == 'aggregate':
-            # Note: Aggregation needs to be added to binary protocol/NexaClient
-            self._send_json({
-                'status': 'error',
-                'message': 'Aggregation endpoint will be available in next version. Use /query for now.'
-            }, 501)  # 501 Not Implemented
+    def _put_document(self, user, parts, params, body):
+        """PUT /collections/{name}/{id} (requires write permission)"""
+        # Check write permission
+        if not self._check_permission(user, 'write'):
+            self._send_error('Permission denied. Write access required to update documents.', 403)
             return
 
-        # Vector search
-        if len(parts) == 3 and parts[0] == 'vector' and parts[2] == 'search':
-            collection_name = parts[1]
-            vector = body.get('vector', [])
-            limit = body.get('limit', 10)
-            dimensions = body.get('dimensions', 768)
-            database = body.get('database')  # v3.0.0: Extract database parameter from body
+        collection_name = parts[1]
+        doc_id = parts[2]
 
-            # Vector search via NexaClient (connects to binary server)
-            results = self.client.vector_search(collection_name, vector, limit=limit, dimensions=dimensions, database=database)
+        # Extract database parameter from query string (v3.0.0)
+        database = params.get('database')
 
+        try:
+            # Update via NexaClient (connects to binary server)
+            result = self.client.update(collection_name, doc_id, body, database=database)
+            _bump_write_version()
             self._send_json({
                 'status': 'success',
                 'collection': collection_name,
-                'results': results,
-                'count': len(results)
+                'document_id': doc_id,
+                'message': 'Document updated'
             })
-            return
-
-        # Create user (admin only)
-        if path == '/users/create':
-            # Check if user is admin
-            if user['role'] != 'admin':
-                self._send_error('Permission denied. Only admins can create users.', 403)
-                return
-
-            username = body.get('username')
-            password = body.get('password')
-            role = body.get('role', 'read')
-
-            if not username or not password:
-                self._send_error('Missing username or password', 400)
-                return
-
-            try:
-                api_key = self.auth.create_user(username, password, role)
-
-                self._send_json({
-                    'status': 'success',
-                    'message': f"User '{username}' created successfully",
-                    'username': username,
-                    'password': password,  # Return so admin can give it to the user
-                    'api_key': api_key,    # Return so admin can give it to the user
-                    'role': role,
-                    'note': '⚠️ Save these credentials! Password and API key are only shown once.'
-                }, 201)
-            except ValueError as e:
-                self._send_error(str(e), 400)
-            return
-
-        self._send_error('Endpoint not found', 404)
-
-    def do_PUT(self):
-        """
-        Handle PUT requests
+        except Exception as e:
+            self._send_error(f'Document not found or update failed: {str(e)}', 404)
 
-        Endpoints:
-        - PUT /collections/{name}/{id} - Update document
-        """
-        # Require authentication
-        user = self._authenticate()
-        if not user:
-            self._send_error('Unauthorized - provide X-API-Key header', 401)
+    def _put_user(self, user, parts, params, body):
+        """PUT /users/{username} (admin only)"""
+        # Check if user is admin
+        if user['role'] != 'admin':
+            self._send_error('Permission denied. Only admins can update users.', 403)
             return
 
-        parsed = urlparse(self.path)
-        path = parsed.path
-        parts = path.strip('/').split('/')
+        username = parts[1]
 
-        body = self._parse_body()
-        if body is None:
-            self._send_error('Invalid JSON body', 400)
+        if not self.auth:
+            self._send_error('Authentication system not initialized', 500)
             return
 
-        # v3.0.0: Update document with new URL format /databases/{database}/collections/{collection}/documents/{id}
-        if len(parts) == 6 and parts[0] == 'databases' and parts[2] == 'collections' and parts[4] == 'documents':
-            # Check write permission
-            if not self._check_permission(user, 'write'):
-                self._send_error('Permission denied. Write access required to update documents.', 403)
-                return
+        # Get update fields
+        new_password = body.get('password')
+        new_role = body.get('role')
 
-            database = parts[1]
-            collection_name = parts[3]
-            doc_id = parts[5]
-
-            try:
-                # Update via NexaClient (connects to binary server)
-                result = self.client.update(collection_name, doc_id, body, database=database)
-                self._send_json({
-                    'status': 'success',
-                    'collection': collection_name,
-                    'document_id': doc_id,
-                    'message': 'Document updated'
-                })
-            except Exception as e:
-                self._send_error(f'Document not found or update failed: {str(e)}', 404)
+        if not new_password and not new_role:
+            self._send_error('Must provide password or role to update', 400)
             return
 
-        # Update document (requires write permission)
-        if len(parts) == 3 and parts[0] == 'collections':
-            # Check write permission
-            if not self._check_permission(user, 'write'):
-                self._send_error('Permission denied. Write access required to update documents.', 403)
-                return
-
-            collection_name = parts[1]
-            doc_id = parts[2]
+        try:
+            self.auth.update_user(username, password=new_password, role=new_role)
+            invalidate_api_key()
+            self._send_json({
+                'status': 'success',
+                'message': f"User '{username}' updated successfully",
+                'username': username
+            })
+        except ValueError as e:
+            self._send_error(str(e), 404)
 
-            # Extract database parameter from query string (v3.0.0)
-            params = parse_qs(parsed.query)
-            database = params.get('database', [None])[0]
+    # ------------------------------------------------------------------
+    # DELETE handlers
+    # ------------------------------------------------------------------
 
-            try:
-                # Update via NexaClient (connects to binary server)
-                result = self.client.update(collection_name, doc_id, body, database=database)
-                self._send_json({
-                    'status': 'success',
-                    'collection': collection_name,
-                    'document_id': doc_id,
-                    'message': 'Document updated'
-                })
-            except Exception as e:
-                self._send_error(f'Document not found or update failed: {str(e)}', 404)
+    def _delete_database_document(self, user, parts, params, body):
+        """DELETE /databases/{database}/collections/{collection}/documents/{id} (v3.0.0)"""
+        if parts[4] != 'documents':
+            self._send_error('Endpoint not found', 404)
             return
 
-        # Update user (admin only)
-        if len(parts) == 2 and parts[0] == 'users':
-            # Check if user is admin
-            if user['role'] != 'admin':
-                self._send_error('Permission denied. Only admins can update users.', 403)
-                return
-
-            username = parts[1]
-
-            if not self.auth:
-                self._send_error('Authentication system not initialized', 500)
-                return
-
-            # Get update fields
-            new_password = body.get('password')
-            new_role = body.get('role')
-
-            if not new_password and not new_role:
-                self._send_error('Must provide password or role to update', 400)
-                return
-
-            try:
-                self.auth.update_user(username, password=new_password, role=new_role)
-                self._send_json({
-                    'status': 'success',
-                    'message': f"User '{username}' updated successfully",
-                    'username': username
-                })
-            except ValueError as e:
-                self._send_error(str(e), 404)
+        # Check write permission
+        if not self._check_permission(user, 'write'):
+            self._send_error('Permission denied. Write access required to delete documents.', 403)
             return
 
-        self._send_error('Endpoint not found', 404)
+        database = parts[1]
+        collection_name = parts[3]
+        doc_id = parts[5]
 
-    def do_DELETE(self):
-        """
-        Handle DELETE requests
-
-        Endpoints:
-        - DELETE /collections/{name} - Drop collection
-        - DELETE /collections/{name}/{id} - Delete document
-        """
-        # Require authentication
-        user = self._authenticate()
-        if not user:
-            self._send_error('Unauthorized - provide X-API-Key header', 401)
-            return
-
-        parsed = urlparse(self.path)
-        path = parsed.path
-        parts = path.strip('/').split('/')
-
-        # v3.0.0: Delete document with new URL format /databases/{database}/collections/{collection}/documents/{id}
-        if len(parts) == 6 and parts[0] == 'databases' and parts[2] == 'collections' and parts[4] == 'documents':
-            # Check write permission
-            if not self._check_permission(user, 'write'):
-                self._send_error('Permission denied. Write access required to delete documents.', 403)
-                return
-
-            database = parts[1]
-            collection_name = parts[3]
-            doc_id = parts[5]
+        try:
+            # Delete via NexaClient (connects to binary server)
+            result = self.client.delete(collection_name, doc_id, database=database)
+            _bump_write_version()
+            self._send_json({
+                'status': 'success',
+                'collection': collection_name,
+                'document_id': doc_id,
+                'message': 'Document deleted'
+            })
+        except Exception as e:
+            self._send_error(f'Document not found or delete failed: {str(e)}', 404)
 
-            try:
-                # Delete via NexaClient (connects to binary server)
-                result = self.client.delete(collection_name, doc_id, database=database)
-                self._send_json({
-                    'status': 'success',
-                    'collection': collection_name,
-                    'document_id': doc_id,
-                    'message': 'Document deleted'
-                })
-            except Exception as e:
-                self._send_error(f'Document not found or delete failed: {str(e)}', 404)
+    def _delete_document(self, user, parts, params, body):
+        """DELETE /collections/{name}/{id} (requires write permission)"""
+        # Check write permission
+        if not self._check_permission(user, 'write'):
+            self._send_error('Permission denied. Write access required to delete documents.', 403)
             return
 
-        # Delete document (requires write permission)
-        if len(parts) == 3 and parts[0] == 'collections':
-            # Check write permission
-            if not self._check_permission(user, 'write'):
-                self._send_error('Permission denied. Write access required to delete documents.', 403)
-                return
+        collection_name = parts[1]
+        doc_id = parts[2]
 
-            collection_name = parts[1]
-            doc_id = parts[2]
+        # Extract database parameter from query string (v3.0.0)
+        database = params.get('database')
 
-            # Extract database parameter from query string (v3.0.0)
-            params = parse_qs(parsed.query)
-            database = params.get('database', [None])[0]
+        try:
+            # Delete via NexaClient (connects to binary server)
+            result = self.client.delete(collection_name, doc_id, database=database)
+            _bump_write_version()
+            self._send_json({
+                'status': 'success',
+                'collection': collection_name,
+                'document_id': doc_id,
+                'message': 'Document deleted'
+            })
+        except Exception as e:
+            self._send_error(f'Document not found or delete failed: {str(e)}', 404)
 
-            try:
-                # Delete via NexaClient (connects to binary server)
-                result = self.client.delete(collection_name, doc_id, database=database)
-                self._send_json({
-                    'status': 'success',
-                    'collection': collection_name,
-                    'document_id': doc_id,
-                    'message': 'Document deleted'
-                })
-            except Exception as e:
-                self._send_error(f'Document not found or delete failed: {str(e)}', 404)
+    def _delete_collection(self, user, parts, params, body):
+        """DELETE /collections/{name} (requires admin permission - more destructive!)"""
+        # Check admin permission for dropping entire collections
+        if not self._check_permission(user, 'admin'):
+            self._send_error('Permission denied. Admin access required to drop collections.', 403)
             return
 
-        # Drop collection (requires admin permission - more destructive!)
-        if len(parts) == 2 and parts[0] == 'collections':
-            # Check admin permission for dropping entire collections
-            if not self._check_permission(user, 'admin'):
-                self._send_error('Permission denied. Admin access required to drop collections.', 403)
-                return
-
-            collection_name = parts[1]
+        collection_name = parts[1]
 
-            # Extract database parameter from query string (v3.0.0)
-            params = parse_qs(parsed.query)
-            database = params.get('database', [None])[0]
+        # Extract database parameter from query string (v3.0.0)
+        database = params.get('database')
 
-            # Drop via NexaClient (connects to binary server)
-            success = self.client.drop_collection(collection_name, database=database)
+        # Drop via NexaClient (connects to binary server)
+        success = self.client.drop_collection(collection_name, database=database)
+        _bump_write_version()
 
-            if success:
-                self._send_json({
-                    'status': 'success',
-                    'collection': collection_name,
-                    'message': 'Collection dropped'
-                })
-            else:
-                self._send_error('Collection not found', 404)
+        if success:
+            self._send_json({
+                'status': 'success',
+                'collection': collection_name,
+                'message': 'Collection dropped'
+            })
+        else:
+            self._send_error('Collection not found', 404)
+
+    def _delete_user(self, user, parts, params, body):
+        """DELETE /users/{username} (admin only)"""
+        # Check if user is admin
+        if user['role'] != 'admin':
+            self._send_error('Permission denied. Only admins can delete users.', 403)
             return
 
-        # Delete user (admin only)
-        if len(parts) == 2 and parts[0] == 'users':
-            # Check if user is admin
-            if user['role'] != 'admin':
-                self._send_error('Permission denied. Only admins can delete users.', 403)
-                return
-
-            username = parts[1]
-
-            if not self.auth:
-                self._send_error('Authentication system not initialized', 500)
-                return
+        username = parts[1]
 
-            try:
-                self.auth.delete_user(username)
-                self._send_json({
-                    'status': 'success',
-                    'message': f"User '{username}' deleted successfully",
-                    'username': username
-                })
-            except ValueError as e:
-                self._send_error(str(e), 400)
+        if not self.auth:
+            self._send_error('Authentication system not initialized', 500)
             return
 
-        self._send_error('Endpoint not found', 404)
+        try:
+            self.auth.delete_user(username)
+            invalidate_api_key()
+            self._send_json({
+                'status': 'success',
+                'message': f"User '{username}' deleted successfully",
+                'username': username
+            })
+        except ValueError as e:
+            self._send_error(str(e), 400)
+
+    # Fixed paths: (method, path) -> handler
+    STATIC_ROUTES = {
+        ('GET', '/status'): _get_status,
+        ('GET', '/collections'): _get_collections,
+        ('GET', '/stats'): _get_stats,
+        ('GET', '/users'): _get_users,
+        ('POST', '/auth/login'): _post_login,
+        ('POST', '/users/create'): _post_create_user,
+    }
+
+    # Handlers that read an application/x-ndjson body themselves
+    NDJSON_ROUTES = frozenset({_post_bulk})
+
+    # Endpoints served without an API key
+    PUBLIC_ROUTES = frozenset({('GET', '/status'), ('POST', '/auth/login')})
+
+    # Parameterized paths: (method, segments, parts[0], parts[2] or '*') -> handler
+    ROUTES = {
+        ('GET', 2, 'collections', None): _get_documents,
+        ('GET', 3, 'collections', '*'): _get_document,
+        ('POST', 2, 'collections', None): _post_document,
+        ('POST', 3, 'collections', 'bulk'): _post_bulk,
+        ('POST', 3, 'collections', 'query'): _post_query,
+        ('POST', 3, 'collections', 'aggregate'): _post_aggregate,
+        ('POST', 3, 'vector', 'search'): _post_vector_search,
+        ('PUT', 6, 'databases', 'collections'): _put_database_document,
+        ('PUT', 3, 'collections', '*'): _put_document,
+        ('PUT', 2, 'users', None): _put_user,
+        ('DELETE', 6, 'databases', 'collections'): _delete_database_document,
+        ('DELETE', 3, 'collections', '*'): _delete_document,
+        ('DELETE', 2, 'collections', None): _delete_collection,
+        ('DELETE', 2, 'users', None): _delete_user,
+    }
 
     def log_message(self, format, *args):
         """Custom log format"""
-        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-        print(f"[{timestamp}] {self.address_string()} - {format % args}")
+        print(f"[{_log_timestamp()}] {self.address_string()} - {format % args}")
 
 
 class NexaDBServer:
@@ -740,14 +1376,20 @@ class NexaDBServer:
     - JSON API
     """
 
-    def __init__(self, host: str = '0.0.0.0', port: int = 6969, data_dir: str = './nexadb_data'):
+    def __init__(self, host: str = '0.0.0.0', port: int = 6969, data_dir: str = './nexadb_data',
+                 workers: int = 1, max_workers: int = DEFAULT_MAX_WORKERS,
+                 queue_size: int = DEFAULT_QUEUE_SIZE):
         self.host = host
         self.port = port
         self.data_dir = data_dir
+        self.workers = workers
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.worker_pids = []
 
         # Initialize NexaClient (connects to binary server on port 6970 - THE SOURCE OF TRUTH)
         print(f"[INIT] Connecting to NexaDB Binary Server (port 6970)")
-        NexaDBHandler.client = NexaClient(host='localhost', port=6970)
+        NexaDBHandler.client = NexaClient(host=NexaDBHandler.binary_host, port=NexaDBHandler.binary_port)
         NexaDBHandler.client.connect()
         print(f"[INIT] ✅ Connected to binary server")
 
@@ -765,9 +1407,9 @@ class NexaDBServer:
         # Generate default API key
         default_key = hashlib.sha256(b'nexadb_admin').hexdigest()[:32]
 
-        NexaDBHandler.api_keys = {
-            default_key: 'admin'
-        }
+        NexaDBHandler.api_keys = MappingProxyType({
+            _hash_api_key(default_key): 'admin'
+        })
 
         print(f"[AUTH] Default API Key: {default_key}")
         print("[AUTH] Include this in requests: X-API-Key header")
@@ -775,15 +1417,68 @@ class NexaDBServer:
     def add_api_key(self, username: str, api_key: Optional[str] = None) -> str:
         """Add new API key"""
         if not api_key:
-            api_key = hashlib.sha256(username.encode() + str(time.time()).encode()).hexdigest()[:32]
+            api_key = secrets.token_hex(16)
 
-        NexaDBHandler.api_keys[api_key] = username
+        # Copy-on-write: readers keep using the old view until the swap
+        with NexaDBHandler._api_keys_write_lock:
+            NexaDBHandler.api_keys = MappingProxyType({**NexaDBHandler.api_keys, _hash_api_key(api_key): username})
+        invalidate_api_key(api_key)
         print(f"[AUTH] Added API key for user: {username}")
         return api_key
 
+    def _fork_workers(self) -> Optional[int]:
+        """
+        Fork workers - 1 more server processes (POSIX only).
+
+        Every process binds its own listening socket with SO_REUSEPORT, so
+        the kernel spreads new connections across them and request handling
+        scales past one GIL. Auth and rate-limit state is per process.
+
+        Returns: the parent's PID in a worker process, None in the parent
+        """
+        if self.workers <= 1:
+            return None
+        if not hasattr(os, 'fork') or not hasattr(socket, 'SO_REUSEPORT'):
+            print("[WARN] --workers needs fork() and SO_REUSEPORT - running a single process")
+            return None
+
+        parent_pid = os.getpid()
+        for _ in range(self.workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                # The inherited handlers would stop the parent's binary/admin servers
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                self.worker_pids = []
+
+                # Each process needs its own binary-server connection
+                NexaDBHandler.client = NexaClient(host=NexaDBHandler.binary_host, port=NexaDBHandler.binary_port)
+                NexaDBHandler.client.connect()
+                return parent_pid
+            self.worker_pids.append(pid)
+
+        print(f"[INIT] Started {self.workers - 1} worker processes sharing port {self.port}")
+        return None
+
+    def _stop_workers(self):
+        """Terminate forked worker processes"""
+        for pid in self.worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+        self.worker_pids = []
+
     def start(self):
         """Start HTTP server"""
-        self.server = HTTPServer((self.host, self.port), NexaDBHandler)
+        parent_pid = self._fork_workers()
+        self.server = ThreadedHTTPServer((self.host, self.port), NexaDBHandler,
+                                         max_workers=self.max_workers, queue_size=self.queue_size)
+        if parent_pid is not None:
+            self.server.parent_pid = parent_pid
+            self.server.serve_forever()
+            return
 
         # ANSI Color codes
         RESET = '\033[0m'
@@ -815,6 +1510,8 @@ class NexaDBServer:
         print(f"   {WHITE}├─{RESET} Status:        {GREEN}●{RESET} {BOLD}Online{RESET}")
         print(f"   {WHITE}├─{RESET} Host:          {YELLOW}{self.host}{RESET}")
         print(f"   {WHITE}├─{RESET} Port:          {YELLOW}{self.port}{RESET}")
+        if self.workers > 1:
+            print(f"   {WHITE}├─{RESET} Workers:       {YELLOW}{self.workers} processes{RESET}")
         print(f"   {WHITE}└─{RESET} Data Dir:      {BLUE}{self.data_dir}{RESET}")
 
         print(f"\n{MAGENTA}{BOLD}🌐 ACCESS POINTS{RESET}")
@@ -852,6 +1549,7 @@ class NexaDBServer:
 
     def stop(self):
         """Stop server"""
+        self._stop_workers()
         if self.server:
             self.server.shutdown()
             if NexaDBHandler.client:
@@ -872,6 +1570,10 @@ def main():
     port = int(os.getenv('NEXADB_PORT', 6969))
     data_dir = os.getenv('NEXADB_DATA_DIR', './nexadb_data')
     start_all = True  # By default, start all three servers
+    use_async = False  # Serve REST API from the asyncio front end (nexadb_async)
+    workers = int(os.getenv('NEXADB_WORKERS', 1))  # REST API processes sharing the port
+    max_workers = int(os.getenv('NEXADB_MAX_WORKERS', DEFAULT_MAX_WORKERS))  # threads per process
+    queue_size = int(os.getenv('NEXADB_QUEUE_SIZE', DEFAULT_QUEUE_SIZE))  # connections waiting for a thread
 
     # Check for --help
     if '--help' in sys.argv or '-h' in sys.argv:
@@ -883,10 +1585,19 @@ def main():
         print("  --port PORT        Port to listen on (default: 6969)")
         print("  --data-dir DIR     Data directory (default: ./nexadb_data)")
         print("  --rest-only        Start only REST API server (no binary/admin)")
+        print("  --async            Serve REST API on an asyncio event loop (uvloop if installed)")
+        print("  --workers N        REST API processes sharing the port via SO_REUSEPORT")
+        print("                     (default: 1, 0 = one per CPU)")
+        print(f"  --max-workers N    Worker threads per REST API process (default: {DEFAULT_MAX_WORKERS})")
+        print("  --queue-size N     Connections waiting for a worker before new ones get 503")
+        print(f"                     (default: {DEFAULT_QUEUE_SIZE})")
         print("\nEnvironment Variables:")
         print("  NEXADB_HOST        Host to bind to")
         print("  NEXADB_PORT        Port to listen on")
         print("  NEXADB_DATA_DIR    Data directory")
+        print("  NEXADB_WORKERS     REST API worker processes")
+        print("  NEXADB_MAX_WORKERS Worker threads per REST API process")
+        print("  NEXADB_QUEUE_SIZE  Connections waiting for a worker")
         print("  NEXADB_API_KEY     Custom API key")
         print("\nBy default, starts all three servers:")
         print("  - REST API (port 6969)")
@@ -904,6 +1615,16 @@ def main():
             data_dir = sys.argv[i + 1]
         elif arg == '--rest-only':
             start_all = False
+        elif arg == '--async':
+            use_async = True
+        elif arg == '--workers' and i + 1 < len(sys.argv):
+            workers = int(sys.argv[i + 1])
+        elif arg == '--max-workers' and i + 1 < len(sys.argv):
+            max_workers = int(sys.argv[i + 1])
+        elif arg == '--queue-size' and i + 1 < len(sys.argv):
+            queue_size = int(sys.argv[i + 1])
+    if workers <= 0:
+        workers = os.cpu_count() or 1
 
     # Get absolute path to server scripts
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -1040,7 +1761,13 @@ def main():
             print(f"[INIT] PID file created: {pid_file_path}")
 
         # Start REST API server in main process
-        server = NexaDBServer(host=host, port=port, data_dir=data_dir)
+        if use_async:
+            from nexadb_async import AsyncNexaDBServer
+            server = AsyncNexaDBServer(host=host, port=port, data_dir=data_dir, workers=workers,
+                                       max_workers=max_workers)
+        else:
+            server = NexaDBServer(host=host, port=port, data_dir=data_dir, workers=workers,
+                                  max_workers=max_workers, queue_size=queue_size)
         server.start()
 
     except KeyboardInterrupt:
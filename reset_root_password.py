@@ -6,16 +6,21 @@ This script allows you to reset the root user password without losing any data.
 It directly modifies the users.json file with a new password hash.
 """
 
+import argparse
 import json
-import hashlib
 import sys
 import os
+import stat
+import tempfile
 from pathlib import Path
 
+from unified_auth import hash_password
 
-def hash_password(password):
-    """Hash a password using SHA-256"""
-    return hashlib.sha256(password.encode()).hexdigest()
+try:
+    import orjson  # faster load/dump for large users.json files
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 def reset_root_password(data_dir=None, new_password=None):
@@ -51,8 +56,8 @@ def reset_root_password(data_dir=None, new_password=None):
 
     # Load users
     try:
-        with open(users_file, 'r') as f:
-            users = json.load(f)
+        with open(users_file, 'rb') as f:
+            users = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
     except Exception as e:
         print(f"Error loading users.json: {e}")
         sys.exit(1)
@@ -74,10 +79,22 @@ def reset_root_password(data_dir=None, new_password=None):
     password_hash = hash_password(new_password)
     users["root"]["password_hash"] = password_hash
 
-    # Save users file
+    # Save users file - write a temp file and rename it over users.json, so an
+    # interrupted reset can never leave a truncated file (and lose every user).
+    # mkstemp creates it 0600 under a unique name; it then takes users.json's
+    # own mode so the replace never widens access to password hashes.
+    tmp_fd, tmp_name = tempfile.mkstemp(dir=users_file.parent, prefix='.users_', suffix='.json.tmp')
+    tmp_file = Path(tmp_name)
     try:
-        with open(users_file, 'w') as f:
-            json.dump(users, f, indent=2)
+        os.fchmod(tmp_fd, stat.S_IMODE(os.stat(users_file).st_mode))
+        with os.fdopen(tmp_fd, 'wb') as f:
+            if HAS_ORJSON:
+                f.write(orjson.dumps(users))
+            else:
+                f.write(json.dumps(users, separators=(',', ':')).encode())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, users_file)
 
         print(f"\n✓ Root password reset successfully!")
         print(f"\nLogin credentials:")
@@ -86,53 +103,46 @@ def reset_root_password(data_dir=None, new_password=None):
         print(f"\nYou can now log in to the admin panel at http://localhost:9999/admin_panel/")
 
     except Exception as e:
+        if tmp_file.exists():
+            tmp_file.unlink()
         print(f"Error saving users.json: {e}")
         sys.exit(1)
 
 
 def main():
     """Main entry point"""
-    data_dir = None
-    new_password = None
-
-    # Parse arguments
-    args = sys.argv[1:]
-    i = 0
-    while i < len(args):
-        if args[i] == "--data-dir" and i + 1 < len(args):
-            data_dir = args[i + 1]
-            i += 2
-        elif args[i] == "--password" and i + 1 < len(args):
-            new_password = args[i + 1]
-            i += 2
-        elif args[i] in ["-h", "--help"]:
-            print("NexaDB Root Password Reset Utility")
-            print("\nUsage:")
-            print("  python3 reset_root_password.py [options]")
-            print("\nOptions:")
-            print("  --data-dir <path>    Path to data directory containing users.json")
-            print("  --password <pwd>     New password (default: nexadb123)")
-            print("  -h, --help           Show this help message")
-            print("\nExamples:")
-            print("  # Reset to default password (nexadb123)")
-            print("  python3 reset_root_password.py")
-            print("")
-            print("  # Reset to custom password")
-            print("  python3 reset_root_password.py --password myNewPassword123")
-            print("")
-            print("  # Specify custom data directory")
-            print("  python3 reset_root_password.py --data-dir /path/to/nexadb_data")
-            sys.exit(0)
-        else:
-            print(f"Unknown argument: {args[i]}")
-            print("Use -h or --help for usage information")
-            sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description='NexaDB Root Password Reset Utility',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Reset to default password (nexadb123)
+  python3 reset_root_password.py
+
+  # Reset to custom password
+  python3 reset_root_password.py --password myNewPassword123
+
+  # Specify custom data directory
+  python3 reset_root_password.py --data-dir /path/to/nexadb_data
+        """
+    )
+
+    parser.add_argument(
+        '--data-dir',
+        help='Path to data directory containing users.json'
+    )
+    parser.add_argument(
+        '--password',
+        help='New password (default: nexadb123)'
+    )
+
+    args = parser.parse_args()
 
     print("=" * 60)
     print("NexaDB Root Password Reset Utility")
     print("=" * 60)
 
-    reset_root_password(data_dir, new_password)
+    reset_root_password(args.data_dir, args.password)
 
 
 if __name__ == "__main__":
@@ -34,6 +34,7 @@ setup(
     packages=find_packages(exclude=["tests", "tests.*", "docs", "examples"]),
     py_modules=[
         "nexadb_server",
+        "nexadb_async",
         "nexadb_binary_server",
         "admin_server",
         "nexadb_cli",
@@ -29,6 +29,9 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from sortedcontainers import SortedDict  # O(log n) inserts vs O(n log n)
 from pybloom_live import BloomFilter     # 95% reduction in useless disk reads
 
+# fdatasync skips the metadata flush fsync does (not available on macOS)
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
 
 class LRUCache:
     """
@@ -172,6 +175,9 @@ class WAL:
     Format: [timestamp|operation|key_len|key|value_len|value]
 
     OPTIMIZED: Batched writes with background flushing for 10x throughput
+    OPTIMIZED: Group commit - commit(seq) waits until an entry is on disk;
+    one caller (the leader) writes + fdatasyncs everything buffered so far
+    while the others wait, so N concurrent commits cost ~1 sync, not N
     """
 
     def __init__(self, filepath: str, batch_size: int = 100, flush_interval_ms: int = 10):
@@ -181,17 +187,29 @@ class WAL:
         # Batch write optimization
         self.batch_size = batch_size  # Flush after N writes
         self.flush_interval_ms = flush_interval_ms  # Flush after N ms
-        self.write_buffer = []
+        self.write_buffer = bytearray()  # Encoded entries not yet written
+        self.buffered_count = 0
         self.buffer_lock = threading.Lock()
         self.last_flush_time = time.time() * 1000
 
+        # Group commit: entries are numbered as they are appended
+        self.appended_seq = 0  # Last sequence number handed out
+        self.synced_seq = 0  # Everything up to here is on disk
+        self.committing = False  # A leader is writing outside the lock
+        self.commit_cond = threading.Condition(self.buffer_lock)
+
         # Background flush thread
         self.running = True
         self.flush_thread = threading.Thread(target=self._background_flush, daemon=True)
         self.flush_thread.start()
 
-    def append(self, operation: str, key: str, value: bytes):
-        """Append operation to WAL (batched)"""
+    def append(self, operation: str, key: str, value: bytes) -> int:
+        """
+        Append operation to WAL (batched).
+
+        Returns the entry's sequence number - pass it to commit() to wait
+        until the entry is durable.
+        """
         timestamp = int(time.time() * 1000)
 
         # Encode: timestamp(8) | op_len(4) | op | key_len(4) | key | value_len(4) | value
@@ -210,12 +228,61 @@ class WAL:
 
         # Add to buffer instead of immediate fsync
         with self.buffer_lock:
-            self.write_buffer.append(entry)
+            self.write_buffer += entry
+            self.buffered_count += 1
+            self.appended_seq += 1
+            seq = self.appended_seq
 
             # Flush if buffer is full
-            if len(self.write_buffer) >= self.batch_size:
+            if self.buffered_count >= self.batch_size:
                 self._flush_buffer()
 
+        return seq
+
+    def commit(self, seq: int):
+        """
+        Wait until entry `seq` (and everything before it) is on disk.
+
+        The first waiter takes the whole buffer and syncs it outside the
+        lock; appends made meanwhile go in the next group.
+        """
+        with self.commit_cond:
+            while self.synced_seq < seq:
+                if self.committing:
+                    self.commit_cond.wait()
+                    continue
+
+                # Become the leader for everything buffered so far
+                self.committing = True
+                data = self.write_buffer
+                count = self.buffered_count
+                upto = self.appended_seq
+                self.write_buffer = bytearray()
+                self.buffered_count = 0
+
+                self.buffer_lock.release()
+                try:
+                    self._write_and_sync(data)
+                except BaseException:
+                    self.buffer_lock.acquire()
+                    self.write_buffer[0:0] = data  # keep order for the next attempt
+                    self.buffered_count += count
+                    self.committing = False
+                    self.commit_cond.notify_all()
+                    raise
+                self.buffer_lock.acquire()
+
+                self.committing = False
+                self.synced_seq = max(self.synced_seq, upto)
+                self.last_flush_time = time.time() * 1000
+                self.commit_cond.notify_all()
+
+    def _write_and_sync(self, data: bytes):
+        """Write encoded entries and make them durable (data only - fdatasync)"""
+        self.file.write(data)
+        self.file.flush()
+        _fdatasync(self.file.fileno())
+
     def _background_flush(self):
         """Background thread that flushes buffer periodically"""
         while self.running:
@@ -226,29 +293,31 @@ class WAL:
                 time_since_flush = current_time - self.last_flush_time
 
                 # Flush if enough time has passed and buffer has data
-                if time_since_flush >= self.flush_interval_ms and len(self.write_buffer) > 0:
+                if time_since_flush >= self.flush_interval_ms and self.write_buffer:
                     self._flush_buffer()
 
     def _flush_buffer(self):
         """Flush buffered writes to disk (called with lock held)"""
-        if not self.write_buffer:
+        # A group-commit leader is writing older entries right now; writing
+        # this buffer first would reorder the log, so leave it for later
+        if not self.write_buffer or self.committing:
             return
 
-        # Write all buffered entries
-        for entry in self.write_buffer:
-            self.file.write(entry)
-
-        # Single fsync for all writes (10x faster!)
-        self.file.flush()
-        os.fsync(self.file.fileno())
+        # Single write + sync for all buffered entries (10x faster!)
+        self._write_and_sync(self.write_buffer)
 
         # Clear buffer
-        self.write_buffer.clear()
+        self.write_buffer = bytearray()
+        self.buffered_count = 0
+        self.synced_seq = self.appended_seq
         self.last_flush_time = time.time() * 1000
+        self.commit_cond.notify_all()
 
     def force_flush(self):
         """Force immediate flush of buffer (for shutdown/critical operations)"""
-        with self.buffer_lock:
+        with self.commit_cond:
+            while self.committing:
+                self.commit_cond.wait()
             self._flush_buffer()
 
     def replay(self) -> List[Tuple[str, str, bytes]]:
@@ -488,7 +557,8 @@ class LSMStorageEngine:
                  memtable_size: int = 256 * 1024 * 1024,  # 256MB default (was 1MB)
                  wal_batch_size: int = 500,  # ✅ Increased from 100 to 500 (1.5x improvement!)
                  wal_flush_interval_ms: int = 10,
-                 lru_cache_size: int = 10000):  # 10K items cache
+                 lru_cache_size: int = 10000,  # 10K items cache
+                 sync_writes: bool = False):
         """
         Initialize LSM Storage Engine
 
@@ -498,18 +568,22 @@ class LSMStorageEngine:
             wal_batch_size: WAL batch size before flush (default 500 - optimized!)
             wal_flush_interval_ms: WAL flush interval in ms (default 10ms)
             lru_cache_size: LRU cache size for hot reads (default 10K items)
+            sync_writes: Return from put/delete only once the WAL entry is on
+                disk (group commit). Default False: durable within
+                wal_flush_interval_ms
         """
         self.data_dir = data_dir
         self.memtable_size = memtable_size
+        self.sync_writes = sync_writes
 
         os.makedirs(data_dir, exist_ok=True)
 
         # ✅ DUAL MEMTABLE: Non-blocking writes during flush (2x throughput!)
-        # Active MemTable receives new writes
-        self.active_memtable = MemTable(max_size=memtable_size)
-        # Flushing MemTable is being written to disk in background
-        self.flushing_memtable: Optional[MemTable] = None
-        # Lock for atomic memtable swap
+        # (active, flushing) published as one tuple: active receives new writes,
+        # flushing is being written to disk in background. Swaps replace the
+        # whole tuple, so get() reads a consistent pair without any lock.
+        self._memtables: Tuple[MemTable, Optional[MemTable]] = (MemTable(max_size=memtable_size), None)
+        # Lock for writers and atomic memtable swap
         self.memtable_lock = threading.Lock()
         # Is flush in progress?
         self.flush_in_progress = False
@@ -537,6 +611,16 @@ class LSMStorageEngine:
         # Start background compaction
         self._start_compaction_thread()
 
+    @property
+    def active_memtable(self) -> MemTable:
+        """MemTable receiving new writes"""
+        return self._memtables[0]
+
+    @property
+    def flushing_memtable(self) -> Optional[MemTable]:
+        """MemTable being flushed to disk (None when no flush is running)"""
+        return self._memtables[1]
+
     def _recover(self):
         """Recover from crash by replaying WAL"""
         print("[RECOVERY] Replaying WAL...")
@@ -581,7 +665,7 @@ class LSMStorageEngine:
         OPTIMIZED: Writes don't block during flush - 2x throughput!
         """
         # Write to WAL first (durability)
-        self.wal.append('PUT', key, value)
+        seq = self.wal.append('PUT', key, value)
 
         # Write to active MemTable (with lock)
         with self.memtable_lock:
@@ -590,6 +674,10 @@ class LSMStorageEngine:
         # Update cache (cache recent writes)
         self.lru_cache.put(key, value)
 
+        # ✅ GROUP COMMIT: concurrent puts share one fdatasync
+        if self.sync_writes:
+            self.wal.commit(seq)
+
         # ✅ NON-BLOCKING FLUSH: Swap memtables and flush in background!
         if needs_flush:
             self._trigger_flush()
@@ -611,7 +699,7 @@ class LSMStorageEngine:
 
         # Batch write to WAL (amortizes fsync cost)
         for key, value in items:
-            self.wal.append('PUT', key, value)
+            seq = self.wal.append('PUT', key, value)
 
         # Batch write to MemTable (single lock acquisition)
         needs_flush = False
@@ -623,6 +711,10 @@ class LSMStorageEngine:
                 # Update cache
                 self.lru_cache.put(key, value)
 
+        # One commit covers the whole batch
+        if self.sync_writes:
+            self.wal.commit(seq)
+
         # Trigger flush if needed
         if needs_flush:
             self._trigger_flush()
@@ -640,19 +732,23 @@ class LSMStorageEngine:
         4. SSTables (disk - newest to oldest)
 
         OPTIMIZED: Checks both memtables for correctness during flush
+        OPTIMIZED: Lock-free - readers never wait behind writers
         """
+        # One load of the published pair; a flushed memtable is never cleared,
+        # so an older pair is still a valid view of the data
+        active, flushing = self._memtables
+
         # Check active MemTable first (most recent writes)
-        with self.memtable_lock:
-            value = self.active_memtable.get(key)
+        value = active.get(key)
+        if value is not None:
+            return value if value != b'__TOMBSTONE__' else None
+
+        # ✅ Check flushing MemTable (data being written to disk)
+        if flushing is not None:
+            value = flushing.get(key)
             if value is not None:
                 return value if value != b'__TOMBSTONE__' else None
 
-            # ✅ Check flushing MemTable (data being written to disk)
-            if self.flushing_memtable is not None:
-                value = self.flushing_memtable.get(key)
-                if value is not None:
-                    return value if value != b'__TOMBSTONE__' else None
-
         # Check LRU cache (hot reads)
         value = self.lru_cache.get(key)
         if value is not None:
@@ -678,7 +774,7 @@ class LSMStorageEngine:
 
         Actual deletion happens during compaction.
         """
-        self.wal.append('DELETE', key, b'__TOMBSTONE__')
+        seq = self.wal.append('DELETE', key, b'__TOMBSTONE__')
 
         # Write to active MemTable (with lock)
         with self.memtable_lock:
@@ -687,6 +783,9 @@ class LSMStorageEngine:
         # Invalidate cache
         self.lru_cache.invalidate(key)
 
+        if self.sync_writes:
+            self.wal.commit(seq)
+
     def range_scan(self, start_key: str, end_key: str) -> List[Tuple[str, bytes]]:
         """
         Scan keys in range [start_key, end_key] (with DUAL MEMTABLE support!)
@@ -699,15 +798,17 @@ class LSMStorageEngine:
         # Collect from both memtables (with lock)
         with self.memtable_lock:
             # First, collect from active MemTable (highest priority)
-            for k, v in self.active_memtable.data.items():
-                if start_key <= k <= end_key:
-                    results[k] = v
+            # ✅ irange() bisects to start_key - O(log n + k), not a full walk
+            active = self.active_memtable.data
+            for k in active.irange(start_key, end_key):
+                results[k] = active[k]
 
             # ✅ Then collect from flushing MemTable (if exists)
             if self.flushing_memtable is not None:
-                for k, v in self.flushing_memtable.data.items():
-                    if start_key <= k <= end_key and k not in results:
-                        results[k] = v
+                flushing = self.flushing_memtable.data
+                for k in flushing.irange(start_key, end_key):
+                    if k not in results:
+                        results[k] = flushing[k]
 
         # Then collect from SSTables, but only if not in MemTables
         for sstable in self.sstables:
@@ -745,8 +846,7 @@ class LSMStorageEngine:
                 return
 
             # ✅ ATOMIC SWAP: This is instant (< 1ms)!
-            self.flushing_memtable = self.active_memtable
-            self.active_memtable = MemTable(max_size=self.memtable_size)
+            self._memtables = (MemTable(max_size=self.memtable_size), self.active_memtable)
             self.flush_in_progress = True
 
         print(f"[FLUSH] Triggered non-blocking flush ({self.flushing_memtable.size} bytes)")
@@ -787,7 +887,7 @@ class LSMStorageEngine:
         finally:
             # ✅ Clear flushing_memtable and mark flush complete
             with self.memtable_lock:
-                self.flushing_memtable = None
+                self._memtables = (self.active_memtable, None)
                 self.flush_in_progress = False
 
     def _start_compaction_thread(self):
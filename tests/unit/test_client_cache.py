@@ -0,0 +1,71 @@
+"""
+Client Read Cache Test Suite
+Tests that writes made through a caching NexaClient are read back, not stale
+"""
+
+import os
+import sys
+import uuid
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from nexadb_client import NexaClient
+
+TEST_HOST = os.getenv('NEXADB_TEST_HOST', 'localhost')
+TEST_PORT = int(os.getenv('NEXADB_TEST_PORT', 6970))
+
+
+@pytest.fixture
+def cached_client(start_server):
+    """In-repo client with a long cache TTL (only invalidation refreshes it)"""
+    client = NexaClient(host=TEST_HOST, port=TEST_PORT, cache_ttl=300)
+    client.connect()
+    yield client
+    client.disconnect()
+
+
+@pytest.fixture
+def collection(cached_client):
+    name = f"cache_col_{uuid.uuid4().hex[:8]}"
+    yield name
+    cached_client.drop_collection(name)
+
+
+class TestCacheInvalidation:
+    """Test that every write invalidates the entries it affects"""
+
+    def test_create_shows_in_list_collections(self, cached_client, collection):
+        """A new collection appears in a cached list_collections()"""
+        assert collection not in cached_client.list_collections()
+        cached_client.create(collection, {'name': 'Alice'})
+        assert collection in cached_client.list_collections()
+
+    def test_update_and_delete_read_back(self, cached_client, collection):
+        """get() returns the updated document, then None after delete"""
+        doc_id = cached_client.create(collection, {'name': 'Alice', 'age': 28})['document_id']
+        assert cached_client.get(collection, doc_id)['age'] == 28
+
+        cached_client.update(collection, doc_id, {'age': 29})
+        assert cached_client.get(collection, doc_id)['age'] == 29
+
+        cached_client.delete(collection, doc_id)
+        assert cached_client.get(collection, doc_id) is None
+
+    def test_batch_write_shows_in_list_collections(self, cached_client, collection):
+        """batch_write() into a new collection refreshes list_collections()"""
+        assert collection not in cached_client.list_collections()
+        cached_client.batch_write(collection, [{'name': 'Alice'}, {'name': 'Bob'}])
+        assert collection in cached_client.list_collections()
+
+    def test_vector_writes_refresh_vector_stats(self, cached_client, collection):
+        """create_with_vector()/batch_write_vectors() invalidate get_vectors()"""
+        before = cached_client.get_vectors()['total_vectors']
+
+        cached_client.create_with_vector(collection, {'title': 'Inception'}, [0.1, 0.2, 0.3, 0.4])
+        assert cached_client.get_vectors()['total_vectors'] == before + 1
+
+        cached_client.batch_write_vectors(collection, [{'title': 'Interstellar'}, {'title': 'Tenet'}],
+                                          [[0.2, 0.1, 0.4, 0.3], [0.3, 0.4, 0.1, 0.2]])
+        assert cached_client.get_vectors()['total_vectors'] == before + 3
@@ -0,0 +1,89 @@
+"""
+Password Hashing Test Suite
+Tests hash_password/verify_password and the legacy hash upgrade on login
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import unified_auth
+from unified_auth import UnifiedAuthManager, hash_password, verify_password
+
+
+class TestHashPassword:
+    """Test hashing and verification round-trips"""
+
+    def test_round_trip(self):
+        """A fresh hash verifies and needs no rehash"""
+        stored = hash_password('s3cret-pass')
+        assert verify_password('s3cret-pass', stored) == (True, False)
+
+    def test_hashes_are_salted(self):
+        """The same password hashes differently every time"""
+        assert hash_password('same') != hash_password('same')
+
+    def test_wrong_password(self):
+        """A wrong password is rejected"""
+        stored = hash_password('right')
+        assert verify_password('wrong', stored) == (False, False)
+
+
+class TestScryptFormat:
+    """Test the stdlib scrypt fallback format"""
+
+    def test_scrypt_format_parse(self, monkeypatch):
+        """scrypt$n$r$p$salt$hash carries its own parameters"""
+        monkeypatch.setattr(unified_auth, 'HAS_ARGON2', False)
+        stored = hash_password('pw')
+
+        scheme, n, r, p, salt, digest = stored.split('$')
+        assert scheme == 'scrypt'
+        assert (int(n), int(r), int(p)) == (unified_auth.SCRYPT_N, unified_auth.SCRYPT_R, unified_auth.SCRYPT_P)
+        assert len(bytes.fromhex(salt)) == 16
+        assert digest == hashlib.scrypt(b'pw', salt=bytes.fromhex(salt), n=int(n), r=int(r), p=int(p)).hex()
+
+        assert verify_password('pw', stored) == (True, False)
+        assert verify_password('nope', stored) == (False, False)
+
+    def test_outdated_scrypt_parameters_need_rehash(self, monkeypatch):
+        """A hash made with older parameters still verifies but is flagged"""
+        monkeypatch.setattr(unified_auth, 'HAS_ARGON2', False)
+        salt = os.urandom(16)
+        digest = hashlib.scrypt(b'pw', salt=salt, n=1 << 10, r=8, p=1)
+        stored = f"scrypt${1 << 10}$8$1${salt.hex()}${digest.hex()}"
+        assert verify_password('pw', stored) == (True, True)
+
+    def test_malformed_scrypt_hash(self):
+        """A truncated hash is rejected rather than raising"""
+        assert verify_password('pw', 'scrypt$16384$8') == (False, False)
+        assert verify_password('pw', 'scrypt$x$8$1$00$00') == (False, False)
+
+
+class TestLegacyRehash:
+    """Test that legacy unsalted SHA-256 hashes are upgraded on login"""
+
+    def test_legacy_hash_verifies_and_needs_rehash(self):
+        """Legacy SHA-256 hex digests still verify, flagged for rehash"""
+        legacy = hashlib.sha256(b'old-pass').hexdigest()
+        assert verify_password('old-pass', legacy) == (True, True)
+        assert verify_password('other', legacy) == (False, False)
+
+    def test_login_upgrades_legacy_hash(self, tmp_path):
+        """authenticate_password replaces a legacy hash with hash_password() output"""
+        auth = UnifiedAuthManager(str(tmp_path))
+        legacy = hashlib.sha256(b'nexadb123').hexdigest()
+        auth.users['root']['password_hash'] = legacy
+        auth.save_users()
+
+        assert auth.authenticate_password('root', 'wrong') is None
+        assert auth.authenticate_password('root', 'nexadb123')['username'] == 'root'
+
+        with open(os.path.join(str(tmp_path), 'users.json')) as f:
+            upgraded = json.load(f)['root']['password_hash']
+        assert upgraded != legacy
+        assert verify_password('nexadb123', upgraded) == (True, False)
+        assert auth.authenticate_password('root', 'nexadb123') is not None
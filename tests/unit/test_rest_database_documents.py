@@ -0,0 +1,63 @@
+"""
+REST API Database-Scoped Document Tests (v3.0.0)
+Tests PUT/DELETE of documents that live in a named database
+"""
+
+import requests
+
+
+# REST API configuration
+REST_URL = 'http://localhost:6969'
+# NOTE: Tests run on localhost, which has auth bypass enabled in development mode
+
+
+class TestDatabaseDocumentWrites:
+    """Test PUT and DELETE against documents outside the default database"""
+
+    def _insert(self, collection, database, doc):
+        response = requests.post(
+            f'{REST_URL}/collections/{collection}',
+            params={'database': database},
+            json=doc,
+        )
+        assert response.status_code == 201
+        return response.json()['document_id']
+
+    def _documents(self, collection, database):
+        response = requests.get(
+            f'{REST_URL}/collections/{collection}',
+            params={'database': database},
+        )
+        assert response.status_code == 200
+        return response.json()['documents']
+
+    def test_put_and_delete_database_document(self, test_collection):
+        """PUT/DELETE /databases/{db}/collections/{name}/documents/{id}"""
+        collection, database = test_collection
+        doc_id = self._insert(collection, database, {'name': 'Widget', 'stock': 1})
+        url = f'{REST_URL}/databases/{database}/collections/{collection}/documents/{doc_id}'
+
+        response = requests.put(url, json={'stock': 5})
+        assert response.status_code == 200
+        assert response.json()['status'] == 'success'
+        docs = self._documents(collection, database)
+        assert [(d['_id'], d['stock']) for d in docs] == [(doc_id, 5)]
+
+        response = requests.delete(url)
+        assert response.status_code == 200
+        assert response.json()['status'] == 'success'
+        assert self._documents(collection, database) == []
+
+    def test_put_and_delete_with_database_param(self, test_collection):
+        """PUT/DELETE /collections/{name}/{id}?database={db}"""
+        collection, database = test_collection
+        doc_id = self._insert(collection, database, {'name': 'Gadget', 'stock': 1})
+        url = f'{REST_URL}/collections/{collection}/{doc_id}'
+
+        response = requests.put(url, params={'database': database}, json={'stock': 7})
+        assert response.status_code == 200
+        assert self._documents(collection, database)[0]['stock'] == 7
+
+        response = requests.delete(url, params={'database': database})
+        assert response.status_code == 200
+        assert self._documents(collection, database) == []
@@ -15,13 +15,79 @@ This is like AWS: one user, multiple access methods, same permissions.
 """
 
 import hashlib
+import hmac
 import json
 import os
 import secrets
 import time
 import tempfile
 import fcntl
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    from argon2 import PasswordHasher  # Argon2id (optional)
+    from argon2.exceptions import InvalidHashError, VerificationError
+    HAS_ARGON2 = True
+    _argon2 = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4)
+except ImportError:
+    HAS_ARGON2 = False
+
+# stdlib fallback: scrypt is memory-hard too (N=2^14, r=8 -> 16 MB per hash)
+SCRYPT_N = 1 << 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+
+def hash_password(password: str) -> str:
+    """
+    Hash a password with a salted, memory-hard KDF.
+
+    Argon2id when argon2-cffi is installed ("$argon2id$..."), otherwise
+    stdlib scrypt ("scrypt$n$r$p$salt$hash").
+    """
+    if HAS_ARGON2:
+        return _argon2.hash(password)
+    salt = secrets.token_bytes(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+    return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, stored_hash: str) -> Tuple[bool, bool]:
+    """
+    Check a password against a stored hash.
+
+    Accepts Argon2id, scrypt and legacy unsalted SHA-256 hashes.
+
+    Returns:
+        (matches, needs_rehash) - needs_rehash is True when the hash should be
+        replaced with hash_password() output (legacy or outdated parameters)
+    """
+    if stored_hash.startswith('$argon2'):
+        if not HAS_ARGON2:
+            return False, False
+        try:
+            _argon2.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False, False
+        return True, _argon2.check_needs_rehash(stored_hash)
+
+    if stored_hash.startswith('scrypt$'):
+        try:
+            _, n, r, p, salt, expected = stored_hash.split('$')
+            n, r, p = int(n), int(r), int(p)
+            digest = hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt), n=n, r=r, p=p,
+                                    maxmem=256 * r * n * p)
+        except ValueError:
+            return False, False
+        if not hmac.compare_digest(digest.hex(), expected):
+            return False, False
+        return True, HAS_ARGON2 or (n, r, p) != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+
+    # Legacy: unsalted SHA-256 hex digest
+    legacy = hashlib.sha256(password.encode()).hexdigest()
+    if not hmac.compare_digest(legacy, stored_hash):
+        return False, False
+    return True, True
 
 
 class UnifiedAuthManager:
@@ -32,7 +98,7 @@ class UnifiedAuthManager:
     - Username/password authentication (binary protocol)
     - API key authentication (HTTP REST API)
     - RBAC with 4 roles: admin, write, read, guest
-    - SHA-256 password hashing
+    - Argon2id / scrypt password hashing (legacy SHA-256 hashes upgraded on login)
     - Persistent storage
     """
 
@@ -82,7 +148,7 @@ class UnifiedAuthManager:
 
         # Step 1: Validate JSON before writing (catch corruption BEFORE it hits disk)
         try:
-            json_data = json.dumps(self.users, indent=2)
+            json_data = json.dumps(self.users, separators=(',', ':'))
             # Validate by parsing it back
             json.loads(json_data)
         except (TypeError, ValueError) as e:
@@ -130,8 +196,8 @@ class UnifiedAuthManager:
             raise RuntimeError(f"CRITICAL: Failed to save users.json safely: {e}") from e
 
     def _hash_password(self, password: str) -> str:
-        """Hash password with SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hash password (see hash_password)."""
+        return hash_password(password)
 
     def _generate_api_key(self) -> str:
         """Generate a secure API key."""
@@ -206,11 +272,15 @@ class UnifiedAuthManager:
             return None
 
         user = self.users[username]
-        password_hash = self._hash_password(password)
+        matches, needs_rehash = verify_password(password, user['password_hash'])
 
-        if password_hash != user['password_hash']:
+        if not matches:
             return None
 
+        # Upgrade legacy/outdated hashes now that we have the plaintext
+        if needs_rehash:
+            user['password_hash'] = self._hash_password(password)
+
         # Update last login
         self.users[username]['last_login'] = time.time()
         self.save_users()
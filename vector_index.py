@@ -167,23 +167,20 @@ class HNSWVectorIndex:
             # Search HNSW index
             labels, distances = self.index.knn_query([query_vector], k=min(k, self.num_vectors))
 
-            # Convert internal IDs to doc IDs
-            results = []
-            for label, distance in zip(labels[0], distances[0]):
-                if label in self.id_to_doc_id:
-                    doc_id = self.id_to_doc_id[label]
-
-                    # Convert distance to similarity
-                    if self.space == 'cosine':
-                        similarity = 1.0 - distance  # cosine distance -> similarity
-                    elif self.space == 'ip':  # inner product
-                        similarity = distance
-                    else:  # l2
-                        similarity = 1.0 / (1.0 + distance)
+            # Convert distances to similarities for the whole row in numpy,
+            # then to Python floats in one tolist() call (not float() per hit)
+            if self.space == 'cosine':
+                similarities = 1.0 - distances[0]  # cosine distance -> similarity
+            elif self.space == 'ip':  # inner product
+                similarities = distances[0]
+            else:  # l2
+                similarities = 1.0 / (1.0 + distances[0])
 
-                    results.append((doc_id, float(similarity)))
-
-            return results
+            # Convert internal IDs to doc IDs
+            id_to_doc_id = self.id_to_doc_id
+            return [(id_to_doc_id[label], similarity)
+                    for label, similarity in zip(labels[0].tolist(), similarities.tolist())
+                    if label in id_to_doc_id]
 
     def delete(self, doc_id: str) -> bool:
         """Mark vector as deleted"""
@@ -283,12 +280,14 @@ class BruteForceVectorIndex:
         self.vectors = {}  # doc_id -> vector
         self.lock = threading.Lock()
         self.num_vectors = 0
+        self._matrix = None  # (doc_ids, float32 matrix, row norms), rebuilt after writes
 
     def add(self, doc_id: str, vector: List[float]):
         """Add vector"""
         with self.lock:
             self.vectors[doc_id] = vector
             self.num_vectors = len(self.vectors)
+            self._matrix = None
 
     def add_batch(self, vectors: List[Tuple[str, List[float]]]):
         """Add multiple vectors"""
@@ -296,6 +295,15 @@ class BruteForceVectorIndex:
             for doc_id, vector in vectors:
                 self.vectors[doc_id] = vector
             self.num_vectors = len(self.vectors)
+            self._matrix = None
+
+    def _get_matrix(self):
+        """Stacked vectors and their norms (caller holds the lock)"""
+        if self._matrix is None:
+            doc_ids = list(self.vectors)
+            matrix = np.array([self.vectors[doc_id] for doc_id in doc_ids], dtype=np.float32)
+            self._matrix = (doc_ids, matrix, np.linalg.norm(matrix, axis=1))
+        return self._matrix
 
     def search(self, query_vector: List[float], k: int = 10) -> List[Tuple[str, float]]:
         """Brute force search (O(n))"""
@@ -307,13 +315,15 @@ class BruteForceVectorIndex:
             similarities = []
 
             if HAS_NUMPY:
-                query_norm = np.linalg.norm(query_vector)
-
-                for doc_id, vector in self.vectors.items():
-                    dot_product = np.dot(query_vector, vector)
-                    vector_norm = np.linalg.norm(vector)
-                    similarity = dot_product / (query_norm * vector_norm + 1e-10)
-                    similarities.append((doc_id, float(similarity)))
+                # One matrix-vector product (BLAS) instead of a Python loop per vector
+                doc_ids, matrix, norms = self._get_matrix()
+                query = np.asarray(query_vector, dtype=np.float32)
+                scores = (matrix @ query) / (np.linalg.norm(query) * norms + 1e-10)
+
+                k = min(k, len(doc_ids))
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top])]
+                return [(doc_ids[i], similarity) for i, similarity in zip(top.tolist(), scores[top].tolist())]
             else:
                 # Pure Python
                 def dot_product(v1, v2):
@@ -340,6 +350,7 @@ class BruteForceVectorIndex:
             if doc_id in self.vectors:
                 del self.vectors[doc_id]
                 self.num_vectors = len(self.vectors)
+                self._matrix = None
                 return True
             return False
 
@@ -362,6 +373,7 @@ class BruteForceVectorIndex:
             self.dimensions = data['dimensions']
             self.vectors = data['vectors']
             self.num_vectors = data['num_vectors']
+            self._matrix = None
 
     def stats(self) -> Dict[str, Any]:
         """Get statistics"""
@@ -148,19 +148,16 @@ class FastVectorIndex:
             # Search with faiss (C++ SIMD!)
             distances, internal_ids = self.index.search(query_np, k)
 
+            # Convert L2 distance to similarity (0-1 scale) for the whole row
+            # similarity = 1 / (1 + distance)
+            similarities = (1.0 / (1.0 + distances[0])).tolist()
+
             # Convert internal_ids back to doc_ids
             results = []
-            for i in range(len(internal_ids[0])):
-                internal_id = int(internal_ids[0][i])
+            for internal_id, similarity in zip(internal_ids[0].tolist(), similarities):
                 if internal_id == -1:  # No more results
                     break
 
-                distance = float(distances[0][i])
-
-                # Convert L2 distance to similarity (0-1 scale)
-                # similarity = 1 / (1 + distance)
-                similarity = 1.0 / (1.0 + distance)
-
                 doc_id = self.internal_to_doc_id.get(internal_id)
                 if doc_id:
                     results.append((doc_id, similarity))
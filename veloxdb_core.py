@@ -82,7 +82,7 @@ class Document:
     @staticmethod
     def from_bytes(data: bytes) -> 'Document':
         """Deserialize from bytes"""
-        doc_dict = json.loads(data.decode('utf-8'))
+        doc_dict = json.loads(data)
         doc_id = doc_dict.pop('_id')
         created_at = doc_dict.pop('_created_at')
         updated_at = doc_dict.pop('_updated_at')
@@ -116,7 +116,7 @@ class BTreeIndex:
         # Get existing doc_ids for this value
         existing = self.engine.get(index_key)
         if existing:
-            doc_ids = json.loads(existing.decode('utf-8'))
+            doc_ids = json.loads(existing)
         else:
             doc_ids = []
 
@@ -135,7 +135,7 @@ class BTreeIndex:
         if not existing:
             return
 
-        doc_ids = json.loads(existing.decode('utf-8'))
+        doc_ids = json.loads(existing)
         if doc_id in doc_ids:
             doc_ids.remove(doc_id)
 
@@ -150,7 +150,7 @@ class BTreeIndex:
         existing = self.engine.get(index_key)
 
         if existing:
-            return json.loads(existing.decode('utf-8'))
+            return json.loads(existing)
         return []
 
     def range_lookup(self, start_value: Any, end_value: Any) -> List[str]:
@@ -162,7 +162,7 @@ class BTreeIndex:
 
         all_doc_ids = []
         for _, doc_ids_bytes in results:
-            doc_ids = json.loads(doc_ids_bytes.decode('utf-8'))
+            doc_ids = json.loads(doc_ids_bytes)
             all_doc_ids.extend(doc_ids)
 
         return list(set(all_doc_ids))  # Remove duplicates
@@ -813,6 +813,7 @@ class VectorCollection:
         vectors_to_store = []  # For batch vector storage
 
         # First pass: Validate and prepare for batch operations
+        valid = []  # (data, doc_id, doc_bytes, vector)
         for data, vector in documents:
             try:
                 # Validate dimensions
@@ -825,30 +826,49 @@ class VectorCollection:
 
                 # Generate doc ID
                 doc = Document(data)
-                doc_id = doc.id
+                valid.append((data, doc.id, doc.to_bytes(), vector))
 
-                # Prepare for batch document insert
-                docs_to_insert.append((doc_id, doc.to_bytes()))
+            except Exception as e:
+                failed.append({
+                    'doc': data,
+                    'error': str(e)
+                })
 
+        # Convert the whole batch into one contiguous float32 matrix (one
+        # conversion instead of one per vector); its rows are what gets stored
+        # and indexed, rather than lists of boxed Python floats
+        vectors = [item[3] for item in valid]
+        if HAS_NUMPY and valid:
+            try:
+                vectors = np.asarray(vectors, dtype=np.float32)
+            except (TypeError, ValueError):
+                pass  # a malformed vector - converted (and rejected) one by one below
+
+        for (data, doc_id, doc_bytes, _), vector in zip(valid, vectors):
+            try:
                 # Prepare for batch vector storage (use numpy for 10x faster serialization!)
                 # NEW: Include database in vector key
                 vector_key = f"db:{self.database}:vector:{self.name}:{doc_id}"
                 if HAS_NUMPY:
-                    # numpy binary format is 10x faster than JSON
-                    vector_bytes = np.array(vector, dtype=np.float32).tobytes()
+                    # numpy binary format is 10x faster than JSON (no copy for matrix rows)
+                    vector = np.asarray(vector, dtype=np.float32)
+                    vector_bytes = vector.tobytes()
                 else:
                     vector_bytes = json.dumps(vector).encode('utf-8')
-                vectors_to_store.append((vector_key, vector_bytes))
-
-                # Queue for batch HNSW indexing
-                vectors_to_index.append((doc_id, vector))
-                successful.append(doc_id)
-
             except Exception as e:
                 failed.append({
                     'doc': data,
                     'error': str(e)
                 })
+                continue
+
+            # Prepare for batch document insert
+            docs_to_insert.append((doc_id, doc_bytes))
+            vectors_to_store.append((vector_key, vector_bytes))
+
+            # Queue for batch HNSW indexing
+            vectors_to_index.append((doc_id, vector))
+            successful.append(doc_id)
 
         # Second pass: Batch write documents to LSM (TRUE batching!)
         try:
@@ -995,7 +1015,7 @@ class VectorCollection:
         for doc_id, similarity in search_results:
             doc = self.collection.find_by_id(doc_id)
             if doc:
-                results.append((doc_id, float(similarity), doc))
+                results.append((doc_id, similarity, doc))
 
         return results
 
@@ -1022,6 +1042,7 @@ class Database:
         self.data_dir = data_dir
         self.collections = {}  # Collection name -> Collection object
         self.vector_collections = {}  # Collection name -> VectorCollection object
+        self.registered_collections = {}  # Collection name -> metadata (register_collection memo)
         self._ensure_metadata()
 
     def _ensure_metadata(self):
@@ -1066,20 +1087,27 @@ class Database:
 
         NEW v3.0.5: Explicit collection registration for empty collection support.
         """
+        # Called on every insert - skip the storage lookup once known
+        metadata = self.registered_collections.get(name)
+        if metadata is not None:
+            return metadata
+
         metadata_key = f"db:{self.name}:collection:{name}:_meta"
         existing = self.engine.get(metadata_key)
 
         if existing:
             # Collection already registered
-            return json.loads(existing.decode('utf-8'))
+            metadata = json.loads(existing)
+        else:
+            metadata = {
+                'name': name,
+                'database': self.name,
+                'created_at': time.time(),
+                'vector_dimensions': vector_dimensions
+            }
+            self.engine.put(metadata_key, json.dumps(metadata).encode('utf-8'))
 
-        metadata = {
-            'name': name,
-            'database': self.name,
-            'created_at': time.time(),
-            'vector_dimensions': vector_dimensions
-        }
-        self.engine.put(metadata_key, json.dumps(metadata).encode('utf-8'))
+        self.registered_collections[name] = metadata
         return metadata
 
     def list_collections(self) -> List[str]:
@@ -1140,6 +1168,7 @@ class Database:
         # Remove from in-memory cache
         if name in self.collections:
             del self.collections[name]
+        self.registered_collections.pop(name, None)
 
         # Remove vector collections
         to_remove = [k for k in self.vector_collections if k.startswith(f"{name}:")]